@@ -3,6 +3,7 @@
 
 from framecheck.frame_check import FrameCheck
 from framecheck.function_registry import register_check_function
+import framecheck.accessor  # registers the DataFrame.framecheck accessor
 
 # Expose only what you want to be part of the public API
 __all__ = ['FrameCheck', 'register_check_function']
\ No newline at end of file
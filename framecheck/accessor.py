@@ -0,0 +1,101 @@
+"""
+accessor.py
+
+Registers the ``DataFrame.framecheck`` accessor, which validates a DataFrame
+against a FrameCheck and remembers the result on that DataFrame.
+"""
+from typing import Any, Dict, Tuple
+import weakref
+import pandas as pd
+
+from framecheck.frame_check import FrameCheck, ValidationResult
+
+
+# Cached results per live DataFrame, keyed by id(); entries are dropped when the frame is collected
+_RESULTS: Dict[int, Dict[Tuple, Tuple]] = {}
+
+
+def _results_for(df: pd.DataFrame) -> Dict[Tuple, Tuple]:
+    """Return the result cache of `df`, creating it (and its cleanup hook) on first use."""
+    results = _RESULTS.get(id(df))
+    if results is None:
+        results = _RESULTS[id(df)] = {}
+        weakref.finalize(df, _RESULTS.pop, id(df), None)
+    return results
+
+
+def _fingerprint(frame_check: FrameCheck) -> Tuple:
+    """Identify the checks and settings of a FrameCheck, so changing either invalidates cached results."""
+    return (
+        tuple(map(id, frame_check._column_checks)),
+        tuple(map(id, frame_check._dataframe_checks)),
+        frame_check._raise_on_error,
+        frame_check._finalized,
+        frame_check._show_warnings,
+        frame_check._logger,
+    )
+
+
+@pd.api.extensions.register_dataframe_accessor("framecheck")
+class FrameCheckAccessor:
+    """
+    Validate a DataFrame through ``df.framecheck`` and reuse earlier results.
+
+    Results are cached per DataFrame object and live exactly as long as that
+    DataFrame: copies and transformed frames start with an empty cache.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The DataFrame the accessor is attached to.
+
+    Notes
+    -----
+    The cache does not notice in-place edits (e.g. ``df.loc[0, 'a'] = 1``);
+    pass ``refresh=True`` after mutating the DataFrame. Warnings are only
+    emitted when validation actually runs.
+
+    Examples
+    --------
+    >>> check = FrameCheck().column('age', type='int', min=0)
+    >>> result = df.framecheck.validate(check)
+    >>> df.framecheck.validate(check) is result
+    True
+    """
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+
+    def validate(self, frame_check: FrameCheck, refresh: bool = False, **kwargs: Any) -> ValidationResult:
+        """
+        Validate the DataFrame, returning the cached result when nothing has changed.
+
+        Parameters
+        ----------
+        frame_check : FrameCheck
+            The checks to run.
+        refresh : bool, default=False
+            If True, ignore any cached result and validate again.
+        **kwargs
+            Options passed to `FrameCheck.validate` (e.g. `short_circuit`);
+            results are cached separately per set of options.
+
+        Returns
+        -------
+        ValidationResult
+            The result of validating this DataFrame with `frame_check`.
+
+        Raises
+        ------
+        ValueError
+            If `raise_on_error()` was set on `frame_check` and validation fails.
+        """
+        results = _results_for(self._df)
+        key = (id(frame_check), tuple(sorted(kwargs.items())))
+        cached = results.get(key)
+        if not refresh and cached is not None and cached[1] == _fingerprint(frame_check):
+            return cached[2]
+
+        result = frame_check.validate(self._df, **kwargs)
+        # Keep a reference to the FrameCheck so its id cannot be reused by another object
+        results[key] = (frame_check, _fingerprint(frame_check), result)
+        return result
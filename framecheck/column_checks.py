@@ -4,13 +4,197 @@ column_checks.py
 Validation rules applied at the column level. Each subclass of ColumnCheck
 implements logic specific to a data type or validation strategy.
 """
-from datetime import datetime, timedelta
+from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
 import numbers
+import re
 import numpy as np
 import pandas as pd
 from typing import Any, List, Optional, Union
-from framecheck.utilities import CheckFactory
+from framecheck.utilities import CheckFactory, FailingIndices, compile_match_regex
+
+
+def _as_mask(mask) -> np.ndarray:
+    """Convert a boolean Series or array to a NumPy bool array, treating NA as False."""
+    if isinstance(mask, pd.Series):
+        return mask.to_numpy(dtype=bool, na_value=False)
+    return np.asarray(mask, dtype=bool)
+
+
+def _notna(series: pd.Series) -> np.ndarray:
+    """
+    Non-null mask of `series` as a NumPy bool array.
+
+    Equivalent to ``series.notna().to_numpy()`` but computed on the values
+    directly, skipping the intermediate boolean Series; on small frames that
+    wrapper costs several times more than the null test itself.
+    """
+    if isinstance(series.dtype, np.dtype):
+        return pd.notna(series.to_numpy())
+    return np.asarray(pd.notna(series.array), dtype=bool)
+
+
+def _isin(series: pd.Series, values) -> np.ndarray:
+    """
+    Membership mask for `series` in `values`.
+
+    A prebuilt unique ``pd.Index`` is probed through its cached hash table,
+    so repeated validations do not rebuild it; other containers go through
+    ``Series.isin``. Categorical columns only probe their categories and
+    gather the answers by integer code.
+    """
+    if isinstance(values, pd.Index):
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # One extra False slot so the missing-value code -1 maps to "not found"
+            found = np.append(values.get_indexer(series.cat.categories) != -1, False)
+            return found[series.cat.codes.to_numpy()]
+        return values.get_indexer(series) != -1
+    return _as_mask(series.isin(values))
+
+
+def _scatter(keep: np.ndarray, sub_mask) -> np.ndarray:
+    """Expand a mask computed on ``series[keep]`` back to the full length of `keep`."""
+    if len(sub_mask) == keep.shape[0]:
+        # Nothing was dropped, so the mask is already full length
+        return _as_mask(sub_mask)
+    full = np.zeros(keep.shape[0], dtype=bool)
+    full[keep] = _as_mask(sub_mask)
+    return full
+
+
+def _failure_sample(values, mask: np.ndarray, size: int = 3, chunk: int = 32) -> list:
+    """
+    First `size` distinct values of `values` where `mask` is True, in order of appearance.
+
+    Equivalent to ``list(values[mask].unique()[:size])`` but only slices and
+    hashes a prefix of the failing rows (`chunk` rows, doubling until enough
+    distinct values are found), so a column with millions of failures does
+    not build a full failing copy and hash table just to report three.
+    """
+    positions = np.flatnonzero(mask)
+    n = chunk
+    while True:
+        head = positions[:n]
+        sample = values.iloc[head].unique() if isinstance(values, pd.Series) else pd.unique(values[head])
+        if len(sample) >= size or n >= len(positions):
+            return list(sample[:size])
+        n *= 2
+
+
+_type_of = np.frompyfunc(type, 1, 1)
+
+
+def _value_types(series: pd.Series) -> np.ndarray:
+    """Object array holding ``type(value)`` for every value of `series`."""
+    return _type_of(series.to_numpy(dtype=object))
+
+
+def _non_integral(values: np.ndarray) -> np.ndarray:
+    """Mask of non-finite or fractional floats; NaN counts as a missing value, not a failure."""
+    with np.errstate(invalid="ignore"):
+        return ~np.isnan(values) & (np.mod(values, 1) != 0)
+
+
+def _non_integer_like_objects(values: np.ndarray, is_integer_like) -> np.ndarray:
+    """
+    Mask of values in an object array that are not integer-like.
+
+    Python ints and floats, the bulk of mixed numeric columns, are classified
+    with vectorized NumPy operations; only the remaining values (strings,
+    bools, NumPy scalars, ...) go through the `is_integer_like` predicate.
+    """
+    types = _type_of(values)
+    ints = types == int
+    floats = types == float
+    invalid = np.zeros(len(values), dtype=bool)
+    if floats.any():
+        invalid[floats] = _non_integral(values[floats].astype(np.float64))
+    others = ~(ints | floats)
+    if others.any():
+        invalid[others] = ~np.frompyfunc(is_integer_like, 1, 1)(values[others]).astype(bool)
+    return invalid
+
+
+def _numeric_kind(dtype) -> str:
+    """
+    NumPy kind character of `dtype`, looking through nullable and Arrow-backed
+    extension dtypes (e.g. ``Int64``, ``float64[pyarrow]``) to the values they
+    hold. Returns 'O' for dtypes without a NumPy equivalent.
+    """
+    if isinstance(dtype, np.dtype):
+        return dtype.kind
+    numpy_dtype = getattr(dtype, "numpy_dtype", None)
+    return numpy_dtype.kind if isinstance(numpy_dtype, np.dtype) else "O"
+
+
+def _float_values(series: pd.Series) -> np.ndarray:
+    """Float64 array of a numeric Series with missing values as NaN, for any numeric dtype."""
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _numeric_values(series: pd.Series):
+    """
+    Return the NumPy array behind a numeric Series, or the Series itself.
+
+    Bound comparisons on the array skip building an intermediate Series;
+    extension and object dtypes keep pandas' NA-aware comparisons.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        return series.to_numpy()
+    return series
+
+
+def _within_bounds(values, lower, upper) -> bool:
+    """
+    True when a numeric array provably holds no values outside `lower`/`upper`.
+
+    Two allocation-free reductions replace building a comparison mask per
+    bound, which is the common case of a passing column. Nullable and
+    Arrow-backed numeric Series reduce with their own NA-skipping kernels
+    (``pyarrow.compute`` for Arrow). Returns False when the answer is unknown
+    (object values, empty or all-missing columns), in which case the caller
+    builds the masks as usual.
+    """
+    if isinstance(values, pd.Series):
+        if _numeric_kind(values.dtype) not in "iuf" or isinstance(values.dtype, np.dtype):
+            return False
+        low, high = values.min(), values.max()
+        if pd.isna(low):
+            return False
+        return (lower is None or low >= lower) and (upper is None or high <= upper)
+    if not isinstance(values, np.ndarray) or values.dtype.kind not in "iuf" or values.size == 0:
+        return False
+    # fmin/fmax skip NaN; an all-NaN array reduces to NaN, which fails both comparisons
+    return (
+        (lower is None or np.fmin.reduce(values) >= lower)
+        and (upper is None or np.fmax.reduce(values) <= upper)
+    )
+
+
+# infer_dtype results (nulls skipped) whose values are all numbers.Real instances
+_REAL_INFERRED_TYPES = frozenset({"empty", "integer", "floating", "mixed-integer-float", "decimal"})
+
+# Day offsets of the relative date keywords accepted as datetime bounds
+_RELATIVE_DAYS = {'yesterday': -1, 'today': 0, 'tomorrow': 1}
+
+
+@lru_cache(maxsize=32)
+def _relative_day(keyword: str, today_ordinal: int) -> datetime:
+    """Midnight of the day `keyword` refers to, counted from the proleptic ordinal `today_ordinal`."""
+    return datetime.fromordinal(today_ordinal + _RELATIVE_DAYS[keyword])
+
+
+def _elementwise_mask(series: pd.Series, predicate) -> np.ndarray:
+    """
+    Apply a Python predicate to every value of an object Series.
+
+    Equivalent to ``series.map(predicate).to_numpy(dtype=bool)`` without
+    building an intermediate Series.
+    """
+    values = series.to_numpy(dtype=object)
+    return np.frompyfunc(predicate, 1, 1)(values).astype(bool)
 
 
 class ColumnCheck:
@@ -25,7 +209,15 @@ class ColumnCheck:
         Whether to treat validation failure as an error (default is True).
     not_null : bool, optional
         Whether to fail if the column contains null values (default is False).
+
+    Attributes
+    ----------
+    thread_safe : bool
+        Whether the check may run on a worker thread alongside other checks.
+        Subclasses calling code of unknown thread safety should set it to False.
     """
+    thread_safe = True
+
     def __init__(self, column_name: str, raise_on_fail: bool = True, not_null: bool = False):
         self.column_name = column_name
         self.raise_on_fail = raise_on_fail
@@ -43,7 +235,8 @@ class ColumnCheck:
         Returns
         -------
         dict
-            Dictionary with 'messages' and 'failing_indices'.
+            Dictionary with 'messages', 'failing_indices' and 'failing_mask'
+            (a boolean array aligned with `series`, True for failing rows).
 
         Raises
         ------
@@ -51,13 +244,32 @@ class ColumnCheck:
             Must be implemented by subclasses.
         """
         raise NotImplementedError("Subclasses should implement validate()")
+
+    @staticmethod
+    def _result(messages: List[str], series: pd.Series, failing_mask: np.ndarray) -> dict:
+        """Package messages and a failing-row mask into a validation result."""
+        return {
+            "messages": messages,
+            "failing_indices": FailingIndices.from_mask(series.index, failing_mask),
+            "failing_mask": failing_mask,
+        }
+
+    def _null_failures(self, notna: np.ndarray, messages: List[str]) -> np.ndarray:
+        """Start a failing-row mask from the non-null mask, flagging nulls when `not_null` is set."""
+        if self.not_null:
+            null_mask = ~notna
+            if null_mask.any():
+                messages.append(f"Column '{self.column_name}' contains missing values.")
+                return null_mask
+        return np.zeros(notna.shape[0], dtype=bool)
         
     def _check_membership_constraints(
         self,
         series: pd.Series,
         in_set: Optional[List[Any]] = None,
         not_in_set: Optional[List[Any]] = None,
-        equals_value: Optional[Any] = None
+        equals_value: Optional[Any] = None,
+        notna: Optional[np.ndarray] = None
     ) -> dict:
         """
         Helper to check if values are in an allowed set, not in a disallowed set,
@@ -67,52 +279,53 @@ class ColumnCheck:
         ----------
         series : pd.Series
             The data to validate.
-        in_set : list, optional
-            Allowed values.
-        not_in_set : list, optional
-            Disallowed values.
+        in_set : list or pd.Index, optional
+            Allowed values. A unique ``pd.Index`` is probed directly.
+        not_in_set : list or pd.Index, optional
+            Disallowed values. A unique ``pd.Index`` is probed directly.
         equals_value : any, optional
             A value all entries must match.
+        notna : np.ndarray, optional
+            Precomputed non-null mask of `series`, to avoid recomputing it.
 
         Returns
         -------
         dict
-            Dictionary with 'messages' and 'failing_indices'.
+            Dictionary with 'messages', 'failing_indices' and 'failing_mask'.
         """
         messages = []
-        failing_indices = set()
+        failing = np.zeros(len(series), dtype=bool)
+        if notna is None:
+            notna = _notna(series)
     
         if equals_value is not None:
-            mask = series != equals_value
-            invalid_values = series[mask].dropna()
-            if not invalid_values.empty:
-                sample = list(invalid_values.unique()[:3])
+            mask = _as_mask(series != equals_value) & notna
+            if mask.any():
+                sample = _failure_sample(series, mask)
                 messages.append(
                     f"Column '{self.column_name}' must equal '{equals_value}', but found: {sample}."
                 )
-                failing_indices.update(invalid_values.index)
+                failing |= mask
     
         elif in_set is not None:
-            mask = ~series.isin(in_set)
-            invalid_values = series[mask].dropna()
-            if not invalid_values.empty:
-                sample = list(invalid_values.unique()[:3])
+            mask = ~_isin(series, in_set) & notna
+            if mask.any():
+                sample = _failure_sample(series, mask)
                 messages.append(
                     f"Column '{self.column_name}' contains unexpected values: {sample}."
                 )
-                failing_indices.update(invalid_values.index)
+                failing |= mask
     
         if not_in_set is not None:
-            mask = series.isin(not_in_set)
-            disallowed_values = series[mask].dropna()
-            if not disallowed_values.empty:
-                sample = list(disallowed_values.unique()[:3])
+            mask = _isin(series, not_in_set) & notna
+            if mask.any():
+                sample = _failure_sample(series, mask)
                 messages.append(
                     f"Column '{self.column_name}' contains disallowed values: {sample}."
                 )
-                failing_indices.update(disallowed_values.index)
+                failing |= mask
     
-        return {"messages": messages, "failing_indices": failing_indices}
+        return self._result(messages, series, failing)
 
 
 
@@ -164,28 +377,36 @@ class BoolColumnCheck(ColumnCheck):
             Dictionary with 'messages' and 'failing_indices'.
         """
         messages = []
-        failing_indices = set()
-
-        if self.not_null:
-            null_mask = series.isna()
-            if null_mask.any():
-                messages.append(f"Column '{self.column_name}' contains missing values.")
-                failing_indices.update(series[null_mask].index)
-
-        invalid_values = series[~series.map(lambda x: isinstance(x, bool)) & series.notna()]
-        if not invalid_values.empty:
-            sample = list(invalid_values.unique()[:3])
+        notna = _notna(series)
+        failing = self._null_failures(notna, messages)
+
+        dtype = series.dtype
+        if pd.api.types.is_bool_dtype(dtype) and not isinstance(dtype, pd.CategoricalDtype):
+            invalid_mask = np.zeros(len(series), dtype=bool)
+        elif dtype == object:
+            # bool cannot be subclassed, so an exact type test matches isinstance;
+            # the builtin type() avoids a Python-level callback per value
+            is_bool = _value_types(series) == bool
+            invalid_mask = ~is_bool & notna
+        elif isinstance(dtype, np.dtype) or _numeric_kind(dtype) in "iuf":
+            # No numpy, nullable or Arrow numeric dtype other than bool holds Python bools
+            invalid_mask = notna
+        else:
+            invalid_mask = ~series.map(lambda x: isinstance(x, bool)).to_numpy(dtype=bool) & notna
+        if invalid_mask.any():
+            sample = _failure_sample(series, invalid_mask)
             messages.append(f"Column '{self.column_name}' contains non-boolean values: {sample}.")
-            failing_indices.update(invalid_values.index)
+            failing |= invalid_mask
 
         result = self._check_membership_constraints(
             series,
-            equals_value=self._equals_value
+            equals_value=self._equals_value,
+            notna=notna
         )
         messages.extend(result["messages"])
-        failing_indices.update(result["failing_indices"])
+        failing |= result["failing_mask"]
 
-        return {"messages": messages, "failing_indices": failing_indices}
+        return self._result(messages, series, failing)
 
 
 
@@ -234,6 +455,9 @@ class DatetimeColumnCheck(ColumnCheck):
     ):
         super().__init__(column_name, raise_on_fail, not_null)
         self.format = format
+        # Bounds given as 'today', 'yesterday' or 'tomorrow' move with the date
+        self._relative_bounds = {}
+        self._resolved_on = date.today().toordinal()
 
         def resolve_bound(value: Optional[Union[str, datetime]], bound_name: str) -> Optional[datetime]:
             """
@@ -267,14 +491,11 @@ class DatetimeColumnCheck(ColumnCheck):
                 return value
             if isinstance(value, str):
                 value_lower = value.lower()
-                if value_lower == 'today':
-                    return datetime.today().replace(hour=0, minute=0, second=0, microsecond=0)
+                if value_lower in _RELATIVE_DAYS:
+                    self._relative_bounds[bound_name] = value_lower
+                    return _relative_day(value_lower, self._resolved_on)
                 if value_lower == 'now':
                     return datetime.now()
-                if value_lower == 'yesterday':
-                    return (datetime.today() - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-                if value_lower == 'tomorrow':
-                    return (datetime.today() + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
                 if self.format:
                     try:
                         return datetime.strptime(value, self.format)
@@ -293,6 +514,55 @@ class DatetimeColumnCheck(ColumnCheck):
         self.before = resolve_bound(before, "before")
         self.after = resolve_bound(after, "after")
 
+        # NumPy scalars for comparing naive datetime64 columns without pandas dispatch
+        self._min_np = self._to_datetime64(self.min)
+        self._max_np = self._to_datetime64(self.max)
+        self._before_np = self._to_datetime64(self.before)
+        self._after_np = self._to_datetime64(self.after)
+
+    def _refresh_relative_bounds(self) -> None:
+        """Re-resolve 'today'/'yesterday'/'tomorrow' bounds once the date has changed."""
+        today = date.today().toordinal()
+        if today == self._resolved_on:
+            return
+        self._resolved_on = today
+        for bound_name, keyword in self._relative_bounds.items():
+            value = _relative_day(keyword, today)
+            if bound_name == "equals":
+                self._equals_value = value
+            else:
+                setattr(self, bound_name, value)
+                setattr(self, f"_{bound_name}_np", self._to_datetime64(value))
+
+    @staticmethod
+    def _to_datetime64(bound) -> Optional[np.datetime64]:
+        """Convert a timezone-naive bound to np.datetime64; None otherwise."""
+        if bound is None or getattr(bound, "tzinfo", None) is not None:
+            return None
+        return pd.Timestamp(bound).to_datetime64()
+
+    @staticmethod
+    def _distinct_types(series: pd.Series, notna: np.ndarray, limit: int = 3) -> list:
+        """Return up to `limit` distinct types among non-null values, in order of appearance."""
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype != object:
+            # A non-object NumPy column holds a single scalar type
+            return [dtype.type] if notna.any() else []
+        non_null = series[notna]
+        if dtype.kind != "O":
+            # Typed extension arrays (tz-aware datetimes, nullable numbers, ...)
+            # box every value as the same scalar type
+            return [type(non_null.iloc[0])] if len(non_null) else []
+        values = non_null.to_numpy() if dtype == object else non_null
+        types = []
+        for value in values:
+            value_type = type(value)
+            if value_type not in types:
+                types.append(value_type)
+                if len(types) == limit:
+                    break
+        return types
+
     def validate(self, series: pd.Series) -> dict:
         """
         Validate that the column contains valid datetime values and respects defined constraints.
@@ -314,61 +584,70 @@ class DatetimeColumnCheck(ColumnCheck):
         ValueError
             If datetime conversion fails using the specified format.
         """
+        if self._relative_bounds:
+            self._refresh_relative_bounds()
         messages = []
-        failing_indices = set()
-
-        if self.not_null:
-            null_mask = series.isna()
-            if null_mask.any():
-                messages.append(f"Column '{self.column_name}' contains missing values.")
-                failing_indices.update(series[null_mask].index)
+        notna = _notna(series)
+        failing = self._null_failures(notna, messages)
 
-        try:
-            coerced = pd.to_datetime(series, format=self.format, errors='coerce')
-        except Exception as exc:
-            raise ValueError(f"Could not coerce values in '{self.column_name}' using format='{self.format}'") from exc
-
-        invalid_mask = coerced.isna() & series.notna()
-        if invalid_mask.any():
-            sample = list(series[invalid_mask].unique()[:3])
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            # Already datetimes: nothing to parse or coerce
+            coerced = series
+        else:
+            try:
+                coerced = pd.to_datetime(series, format=self.format, errors='coerce', cache=True)
+            except Exception as exc:
+                raise ValueError(f"Could not coerce values in '{self.column_name}' using format='{self.format}'") from exc
+
+        invalid = coerced.isna().to_numpy() & notna
+        if invalid.any():
+            sample = _failure_sample(series, invalid)
             messages.append(
                 f"Column '{self.column_name}' contains values that are not valid dates: {sample}."
             )
-            failing_indices.update(series[invalid_mask].index)
+            failing |= invalid
 
-        non_null = series[series.notna()]
-        types = non_null.map(type).unique()
+        types = self._distinct_types(series, notna)
         if len(types) > 1:
             messages.append(
                 f"Column '{self.column_name}' contains inconsistent datetime types: {[t.__name__ for t in types[:3]]}."
             )
 
+        naive = isinstance(coerced.dtype, np.dtype) and coerced.dtype.kind == "M"
+        values = coerced.to_numpy() if naive else None
+
         if self._equals_value is not None:
-            mask = coerced != self._equals_value
-            mask |= invalid_mask
+            equals_np = self._to_datetime64(self._equals_value)
+            if values is not None and equals_np is not None:
+                # NaT compares unequal, so nulls and unparseable values are flagged too
+                mask = np.not_equal(values, equals_np)
+            else:
+                mask = _as_mask(coerced != self._equals_value) | invalid
             if mask.any():
-                sample = list(series[mask].unique()[:3])
+                sample = _failure_sample(series, mask)
                 messages.append(
                     f"Column '{self.column_name}' must equal {self._equals_value.date()}, but found: {sample}."
                 )
-                failing_indices.update(series[mask].index)
+                failing |= mask
         else:
             bounds = [
-                ('min', self.min, lambda x: x < self.min),
-                ('max', self.max, lambda x: x > self.max),
-                ('before', self.before, lambda x: x > self.before),
-                ('after', self.after, lambda x: x < self.after),
+                ('min', self.min, self._min_np, np.less),
+                ('max', self.max, self._max_np, np.greater),
+                ('before', self.before, self._before_np, np.greater),
+                ('after', self.after, self._after_np, np.less),
             ]
-
-            for label, bound, condition in bounds:
+            for label, bound, bound_np, compare in bounds:
                 if bound is not None:
-                    mask = condition(coerced) | invalid_mask
+                    if values is not None and bound_np is not None:
+                        mask = compare(values, bound_np) | invalid
+                    else:
+                        mask = _as_mask(compare(coerced, bound)) | invalid
                     if mask.any():
                         bound_label = bound.date() if hasattr(bound, "date") else bound
                         messages.append(f"Column '{self.column_name}' violates '{label}' constraint: {bound_label}.")
-                        failing_indices.update(series[mask].index)
+                        failing |= mask
 
-        return {"messages": messages, "failing_indices": failing_indices}
+        return self._result(messages, series, failing)
     
 
 @CheckFactory.register('float')
@@ -454,56 +733,82 @@ class FloatColumnCheck(ColumnCheck):
             If both 'in_set' and 'equals' are provided.
         """
         messages = []
-        failing_indices = set()
-
-        if self.not_null:
-            null_mask = series.isna()
-            if null_mask.any():
-                messages.append(f"Column '{self.column_name}' contains missing values.")
-                failing_indices.update(series[null_mask].index)
+        notna = _notna(series)
+        failing = self._null_failures(notna, messages)
 
         valid_numeric_types = (int, float, Decimal, numbers.Real)
-        non_float_like = series[~series.map(lambda x: isinstance(x, valid_numeric_types) or pd.isna(x))]
 
-        if not non_float_like.empty:
-            sample = list(non_float_like.unique()[:3])
+        def is_float_like(x):
+            return isinstance(x, valid_numeric_types) or pd.isna(x)
+
+        dtype = series.dtype
+        if _numeric_kind(dtype) in "biuf":
+            # NumPy, nullable and Arrow-backed numeric dtypes only hold numbers and nulls
+            non_float_like = np.zeros(len(series), dtype=bool)
+        elif dtype == object:
+            values = series.to_numpy()
+            if pd.api.types.infer_dtype(values, skipna=True) in _REAL_INFERRED_TYPES:
+                # One C-level scan proves every value numeric; skip the per-value predicate
+                non_float_like = np.zeros(len(series), dtype=bool)
+            else:
+                non_float_like = ~_elementwise_mask(series, is_float_like)
+        else:
+            non_float_like = ~series.map(is_float_like).to_numpy(dtype=bool)
+
+        if non_float_like.any():
+            sample = _failure_sample(series, non_float_like)
             messages.append(
                 f"Column '{self.column_name}' contains values that are not numeric: {sample}."
             )
-            failing_indices.update(non_float_like.index)
+            failing |= non_float_like
 
-        if non_float_like.index.equals(series.dropna().index):
-            return {"messages": messages, "failing_indices": failing_indices}
+        keep = ~non_float_like
+        if not (keep & notna).any():
+            return self._result(messages, series, failing)
 
-        numeric_series = series.drop(index=non_float_like.index)
+        # Typed numeric columns have nothing to drop, so skip the subset copy
+        numeric_series = series[keep] if non_float_like.any() else series
 
         result = self._check_membership_constraints(
             numeric_series,
             in_set=self.in_set,
             not_in_set=self.not_in_set,
-            equals_value=self._equals_value
+            equals_value=self._equals_value,
+            notna=notna[keep]
         )
         messages.extend(result["messages"])
-        failing_indices.update(result["failing_indices"])
-
-        inf_mask = numeric_series.map(lambda x: isinstance(x, float) and np.isinf(x))
+        failing |= _scatter(keep, result["failing_mask"])
+
+        numeric_dtype = numeric_series.dtype
+        if isinstance(numeric_dtype, np.dtype) and numeric_dtype.kind == "f":
+            inf_mask = np.isinf(numeric_series.to_numpy())
+        elif _numeric_kind(numeric_dtype) == "f":
+            inf_mask = np.isinf(_float_values(numeric_series))
+        elif _numeric_kind(numeric_dtype) in "biu":
+            inf_mask = np.zeros(len(numeric_series), dtype=bool)
+        else:
+            inf_mask = numeric_series.map(lambda x: isinstance(x, float) and np.isinf(x)).to_numpy(dtype=bool)
         if inf_mask.any():
             messages.append(f"Column '{self.column_name}' contains infinite values.")
-            failing_indices.update(numeric_series[inf_mask].index)
+            failing |= _scatter(keep, inf_mask)
+
+        numeric_values = _numeric_values(numeric_series)
+        if _within_bounds(numeric_values, self.min, self.max):
+            return self._result(messages, series, failing)
 
         if self.min is not None:
-            min_mask = numeric_series < self.min
+            min_mask = numeric_values < self.min
             if min_mask.any():
                 messages.append(f"Column '{self.column_name}' has values less than {self.min}.")
-                failing_indices.update(min_mask[min_mask].index)
+                failing |= _scatter(keep, min_mask)
 
         if self.max is not None:
-            max_mask = numeric_series > self.max
+            max_mask = numeric_values > self.max
             if max_mask.any():
                 messages.append(f"Column '{self.column_name}' has values greater than {self.max}.")
-                failing_indices.update(max_mask[max_mask].index)
+                failing |= _scatter(keep, max_mask)
 
-        return {"messages": messages, "failing_indices": failing_indices}
+        return self._result(messages, series, failing)
 
 
 
@@ -584,13 +889,8 @@ class IntColumnCheck(ColumnCheck):
         - Enforces optional constraints like min, max, exact equality, and membership
         """
         messages = []
-        failing_indices = set()
-        
-        if self.not_null:
-            null_mask = series.isna()
-            if null_mask.any():
-                messages.append(f"Column '{self.column_name}' contains missing values.")
-                failing_indices.update(series[null_mask].index)
+        notna = _notna(series)
+        failing = self._null_failures(notna, messages)
 
         def is_integer_like(x):
             if pd.isna(x):
@@ -603,46 +903,76 @@ class IntColumnCheck(ColumnCheck):
                 return True
             return False
 
-        invalid = series[~series.map(is_integer_like)]
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+            invalid_mask = np.zeros(len(series), dtype=bool)
+        elif isinstance(dtype, np.dtype) and dtype.kind == "b":
+            invalid_mask = np.ones(len(series), dtype=bool)
+        elif isinstance(dtype, np.dtype) and dtype.kind == "f":
+            invalid_mask = _non_integral(series.to_numpy())
+        elif _numeric_kind(dtype) in "iu":
+            # Nullable and Arrow-backed integers
+            invalid_mask = np.zeros(len(series), dtype=bool)
+        elif _numeric_kind(dtype) == "f":
+            invalid_mask = _non_integral(_float_values(series))
+        elif dtype == object:
+            values = series.to_numpy()
+            if pd.api.types.infer_dtype(values, skipna=True) in ("empty", "integer"):
+                # Only ints (never bools) and nulls, found in one C-level scan
+                invalid_mask = np.zeros(len(series), dtype=bool)
+            else:
+                invalid_mask = _non_integer_like_objects(values, is_integer_like)
+        else:
+            invalid_mask = ~series.map(is_integer_like).to_numpy(dtype=bool)
 
-        inf_values = invalid[invalid.map(lambda x: isinstance(x, float) and np.isinf(x))]
-        if not inf_values.empty:
+        invalid = series[invalid_mask]
+        if isinstance(invalid.dtype, np.dtype) and invalid.dtype.kind == "f":
+            has_inf = bool(np.isinf(invalid.to_numpy()).any())
+        elif _numeric_kind(invalid.dtype) == "f":
+            has_inf = bool(np.isinf(_float_values(invalid)).any())
+        else:
+            has_inf = bool(invalid.map(lambda x: isinstance(x, float) and np.isinf(x)).any())
+        if has_inf:
             messages.append(f"Column '{self.column_name}' contains infinite values.")
 
         if not invalid.empty:
-            sample = list(invalid.unique()[:3])
+            sample = _failure_sample(series, invalid_mask)
             messages.append(
                 f"Column '{self.column_name}' contains values that are not integer-like (e.g., decimals or strings): {sample}."
             )
-            failing_indices.update(invalid.index)
+            failing |= invalid_mask
 
-        if invalid.index.equals(series.dropna().index):
-            return {"messages": messages, "failing_indices": failing_indices}
+        keep = ~invalid_mask
+        if not (keep & notna).any():
+            return self._result(messages, series, failing)
 
-        valid_series = series.drop(index=invalid.index)
+        valid_series = series[keep] if invalid_mask.any() else series
+        valid_values = _numeric_values(valid_series)
 
-        if self.min is not None:
-            mask = valid_series < self.min
-            if mask.any():
-                messages.append(f"Column '{self.column_name}' has values less than {self.min}.")
-                failing_indices.update(mask[mask].index)
+        if not _within_bounds(valid_values, self.min, self.max):
+            if self.min is not None:
+                mask = valid_values < self.min
+                if mask.any():
+                    messages.append(f"Column '{self.column_name}' has values less than {self.min}.")
+                    failing |= _scatter(keep, mask)
 
-        if self.max is not None:
-            mask = valid_series > self.max
-            if mask.any():
-                messages.append(f"Column '{self.column_name}' has values greater than {self.max}.")
-                failing_indices.update(mask[mask].index)
+            if self.max is not None:
+                mask = valid_values > self.max
+                if mask.any():
+                    messages.append(f"Column '{self.column_name}' has values greater than {self.max}.")
+                    failing |= _scatter(keep, mask)
 
         result = self._check_membership_constraints(
             valid_series,
             in_set=self.in_set,
             not_in_set=self.not_in_set,
-            equals_value=self._equals_value
+            equals_value=self._equals_value,
+            notna=notna[keep]
         )
         messages.extend(result["messages"])
-        failing_indices.update(result["failing_indices"])
+        failing |= _scatter(keep, result["failing_mask"])
 
-        return {"messages": messages, "failing_indices": failing_indices}
+        return self._result(messages, series, failing)
 
 
 
@@ -658,8 +988,9 @@ class StringColumnCheck(ColumnCheck):
     ----------
     column_name : str
         Name of the column to validate.
-    regex : str, optional
-        Regular expression that all values must match.
+    regex : str or re.Pattern, optional
+        Regular expression that all values must match. A precompiled pattern
+        is used as given, keeping its flags.
     in_set : list of str, optional
         Allowed string values.
     not_in_set : list of str, optional
@@ -679,7 +1010,7 @@ class StringColumnCheck(ColumnCheck):
     def __init__(
         self, 
         column_name: str, 
-        regex: Optional[str] = None, 
+        regex: Optional[Union[str, re.Pattern]] = None, 
         in_set: Optional[List[str]] = None,
         not_in_set: Optional[List[str]] = None,
         equals: Optional[str] = None,
@@ -687,7 +1018,13 @@ class StringColumnCheck(ColumnCheck):
         not_null: bool = False
     ):
         super().__init__(column_name, raise_on_fail, not_null)
-        self.regex = regex
+        if isinstance(regex, re.Pattern):
+            # Match with the caller's pattern; keep its source for messages and serialization
+            self.regex = regex.pattern
+            self._pattern = regex
+        else:
+            self.regex = regex
+            self._pattern = compile_match_regex(regex) if regex else None
 
         if equals is not None and in_set is not None:
             raise ValueError("Cannot specify both 'in_set' and 'equals'")
@@ -695,6 +1032,20 @@ class StringColumnCheck(ColumnCheck):
         self.in_set = in_set
         self._equals_value = equals
         self.not_in_set = not_in_set
+        # Hash tables for the allowed/disallowed values are built once and reused
+        self._in_set_index = pd.Index(in_set).unique() if in_set is not None else None
+        self._not_in_set_index = pd.Index(not_in_set).unique() if not_in_set is not None else None
+
+    @staticmethod
+    def _as_strings(non_null: pd.Series) -> np.ndarray:
+        """Return the values as an object array of str, converting only non-str values."""
+        if non_null.dtype == object or pd.api.types.is_string_dtype(non_null.dtype):
+            values = non_null.to_numpy(dtype=object)
+            if pd.api.types.infer_dtype(values, skipna=False) == "string":
+                # Already all str (or str subclasses): reuse the array instead of copying it
+                return values
+            return np.array([v if type(v) is str else str(v) for v in values], dtype=object)
+        return non_null.astype(str).to_numpy(dtype=object)
 
     def validate(self, series: pd.Series) -> dict:
         """
@@ -721,31 +1072,28 @@ class StringColumnCheck(ColumnCheck):
         - Supports null checks if enabled
         """
         messages = []
-        failing_indices = set()
-
-        if self.not_null:
-            null_mask = series.isna()
-            if null_mask.any():
-                messages.append(f"Column '{self.column_name}' contains missing values.")
-                failing_indices.update(series[null_mask].index)
+        notna = _notna(series)
+        failing = self._null_failures(notna, messages)
 
         if self.regex:
-            non_null = series[series.notna()]
-            failed = non_null.astype(str)[~non_null.astype(str).str.match(self.regex)]
-            if not failed.empty:
-                sample = list(failed.unique()[:3])
+            strings = self._as_strings(series[notna])
+            match = self._pattern.match
+            unmatched = np.fromiter((match(s) is None for s in strings), dtype=bool, count=len(strings))
+            if unmatched.any():
+                sample = [str(v) for v in _failure_sample(strings, unmatched)]
                 messages.append(
                     f"Column '{self.column_name}' has values not matching regex '{self.regex}': {sample}."
                 )
-                failing_indices.update(failed.index)
+                failing |= _scatter(notna, unmatched)
 
         result = self._check_membership_constraints(
             series,
-            in_set=self.in_set,
-            not_in_set=self.not_in_set,
-            equals_value=self._equals_value
+            in_set=self._in_set_index,
+            not_in_set=self._not_in_set_index,
+            equals_value=self._equals_value,
+            notna=notna
         )
         messages.extend(result["messages"])
-        failing_indices.update(result["failing_indices"])
+        failing |= result["failing_mask"]
 
-        return {"messages": messages, "failing_indices": failing_indices}
+        return self._result(messages, series, failing)
@@ -3,13 +3,43 @@ dataframe_checks.py
 
 Validation rules applied at the DataFrame level.
 Each check subclass implements a `validate()` method returning validation messages
-and optionally failing row indices.
+and optionally failing row indices. Row-level checks report failures as a
+FailingIndices set backed by a NumPy mask.
 """
 
+import inspect
+import re
+import sys
+import threading
+import numpy as np
 import pandas as pd
 from typing import Optional, List, Dict, Set
 from framecheck.function_registry import is_registered, get_registry_name, get_registered_function
 
+try:
+    import numba
+except ImportError:  # optional dependency
+    numba = None
+from framecheck.utilities import PARALLEL_MIN_ROWS, FailingIndices, compile_regex, map_threaded
+
+
+# Checks with these costs still run after an error when short-circuiting
+_CHEAP_COSTS = frozenset({"O(1)", "O(ncols)"})
+
+# Distinct column layouts remembered per column-structure check
+_COLUMN_MEMO_SIZE = 8
+# Guards the column memos, which checks running on worker threads share
+_COLUMN_MEMO_LOCK = threading.Lock()
+
+# Odd 64-bit multiplier (golden ratio) used to mix integer key columns
+_KEY_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _numba_supports(dtype: np.dtype) -> bool:
+    """Return True if Numba can compile ufunc loops for `dtype` (bool, integer, 32/64-bit float and complex)."""
+    kind = dtype.kind
+    return kind in "biu" or (kind == "f" and dtype.itemsize in (4, 8)) or (kind == "c" and dtype.itemsize in (8, 16))
+
 
 class DataFrameCheck:
     """
@@ -19,10 +49,112 @@ class DataFrameCheck:
     ----------
     raise_on_fail : bool
         If True, failing the check is treated as an error. Otherwise, it's a warning.
+
+    Attributes
+    ----------
+    priority : int
+        Execution order hint; checks with a lower priority run first when the
+        validator short-circuits.
+    cost_hint : str
+        Rough complexity of the check ("O(1)", "O(ncols)", "O(n)", "O(n log n)").
+    thread_safe : bool
+        Whether the check may run on a worker thread alongside other checks.
     """
+    priority = 100
+    cost_hint = "O(n)"
+    thread_safe = True
+    _column_cache = None
+    _column_memo = None
+
     def __init__(self, raise_on_fail: bool = True):
         self.raise_on_fail = raise_on_fail
 
+    @classmethod
+    def run_all(cls, checks: List, df: pd.DataFrame, max_workers: Optional[int] = None) -> List[dict]:
+        """
+        Validate a DataFrame against several checks, concurrently when worthwhile.
+
+        Checks only read the DataFrame, and most of their work happens in
+        pandas/NumPy routines that release the GIL, so independent checks can
+        run in a thread pool. Small inputs are validated sequentially, and
+        checks that are not `thread_safe` always run in the calling thread.
+
+        Parameters
+        ----------
+        checks : list
+            Checks exposing a `validate(df)` method.
+        df : pd.DataFrame
+            DataFrame to validate.
+        max_workers : int, optional
+            Maximum number of threads; 1 validates sequentially. Defaults to
+            one per check, capped at the CPU count.
+
+        Returns
+        -------
+        list of dict
+            Validation results, in the same order as `checks`.
+        """
+        threaded = [i for i, check in enumerate(checks) if getattr(check, "thread_safe", True)]
+        if len(threaded) < 2 or df.shape[0] < PARALLEL_MIN_ROWS or (max_workers is not None and max_workers <= 1):
+            return [check.validate(df) for check in checks]
+        results = dict(zip(threaded, map_threaded(lambda i: checks[i].validate(df), threaded, max_workers)))
+        return [results[i] if i in results else check.validate(df) for i, check in enumerate(checks)]
+
+    def should_run(self, has_errors: bool) -> bool:
+        """
+        Decide whether the check is worth running in short-circuit mode.
+
+        Parameters
+        ----------
+        has_errors : bool
+            Whether an error-level failure has already been recorded.
+
+        Returns
+        -------
+        bool
+            False if the check scales with the number of rows and the
+            validation has already failed; True otherwise.
+        """
+        return not has_errors or self.cost_hint in _CHEAP_COSTS
+
+    def _column_set(self, df: pd.DataFrame) -> frozenset:
+        """
+        Return the DataFrame's column names as a frozenset.
+
+        The set is cached against the (immutable) columns Index object, so
+        revalidating frames that share the same columns skips rehashing them.
+        """
+        columns = df.columns
+        cache = self._column_cache
+        if cache is None or cache[0] is not columns:
+            cache = (columns, frozenset(columns))
+            self._column_cache = cache
+        return cache[1]
+
+    def _memoized_column_messages(self, df: pd.DataFrame, compute) -> list:
+        """
+        Return `compute(columns)` for the DataFrame's column labels, memoized.
+
+        Column-structure checks depend only on the column labels, so batches
+        sharing a layout reuse the earlier messages. Up to
+        `_COLUMN_MEMO_SIZE` layouts are kept, oldest evicted first. The memo
+        is only touched under a lock, so concurrent calls on one check are
+        safe; `compute` runs outside it.
+        """
+        key = tuple(df.columns)
+        with _COLUMN_MEMO_LOCK:
+            memo = self._column_memo
+            if memo is None:
+                memo = self._column_memo = {}
+            messages = memo.get(key)
+        if messages is None:
+            messages = tuple(compute(key))
+            with _COLUMN_MEMO_LOCK:
+                if key not in memo and len(memo) >= _COLUMN_MEMO_SIZE:
+                    del memo[next(iter(memo))]
+                memo[key] = messages
+        return list(messages)
+
     def validate(self, df: pd.DataFrame) -> Dict[str, object]:
         """
         Validate the DataFrame.
@@ -79,6 +211,9 @@ class ColumnComparisonCheck(DataFrameCheck):
     ...                               comparison_type='datetime',
     ...                               description="End date must be after start date")
     """
+    priority = 100
+    cost_hint = "O(n)"
+
     def __init__(
         self,
         left_column: str,
@@ -151,43 +286,76 @@ class ColumnComparisonCheck(DataFrameCheck):
                  ('float' in left_dtype and 'int' in right_dtype):
                 comparison_type = 'numeric'
 
-        # Apply the comparison row by row
-        for idx, row in df.iterrows():
-            left_val = row[self.left_column]
-            right_val = row[self.right_column]
-
-            # Handle null values
-            if pd.isna(left_val) or pd.isna(right_val):
-                failing_indices.add(idx)
-                continue
-
-            # Apply type-specific handling
-            if comparison_type == 'datetime':
-                try:
-                    left_val = pd.to_datetime(left_val)
-                    right_val = pd.to_datetime(right_val)
-                except (ValueError, TypeError):
-                    failing_indices.add(idx)
-                    continue
-            elif comparison_type == 'numeric':
-                try:
-                    left_val = float(left_val)
-                    right_val = float(right_val)
-                except (ValueError, TypeError):
-                    failing_indices.add(idx)
-                    continue
-
-            # Perform the comparison
-            try:
-                if not self.operators[self.operator](left_val, right_val):
-                    failing_indices.add(idx)
-            except TypeError:#nocov
-                failing_indices.add(idx)#nocov
+        left = df[self.left_column]
+        right = df[self.right_column]
+
+        if comparison_type == 'datetime':
+            left_values = self._convert(left, self._to_datetime)
+            right_values = self._convert(right, self._to_datetime)
+        elif comparison_type == 'numeric':
+            left_values = self._convert(left, self._to_float)
+            right_values = self._convert(right, self._to_float)
+        else:
+            left_values = left.to_numpy()
+            right_values = right.to_numpy()
+        # Nulls and values that cannot be converted fail the comparison
+        failing = pd.isna(left_values) | pd.isna(right_values)
+        failing |= ~self._compare(left_values, right_values)
 
+        failing_indices = FailingIndices.from_mask(df.index, failing)
         if failing_indices:
-            messages.append(f"{self.description} (failed on {len(failing_indices)} row(s))")
+            messages.append(f"{self.description} (failed on {failing_indices.count} row(s))")
         return {"messages": messages, "failing_indices": failing_indices}
 
+    @staticmethod
+    def _to_datetime(value):
+        return pd.to_datetime(value)
+
+    @staticmethod
+    def _to_float(value):
+        return float(value)
+
+    @staticmethod
+    def _convert(series: pd.Series, convert) -> np.ndarray:
+        """
+        Apply a scalar conversion to every value, with NaN for values it rejects.
+
+        NumPy numeric columns are converted to float64 in one step; other
+        columns are converted value by value so each value is parsed on its
+        own, as a row-wise comparison would.
+        """
+        dtype = series.dtype
+        if convert is ColumnComparisonCheck._to_float and isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+            return series.to_numpy(dtype=np.float64)
+        if convert is ColumnComparisonCheck._to_datetime and pd.api.types.is_datetime64_any_dtype(dtype):
+            return series.to_numpy()
+
+        def safe(value):
+            if pd.isna(value):
+                return np.nan
+            try:
+                return convert(value)
+            except (ValueError, TypeError):
+                return np.nan
+
+        return np.frompyfunc(safe, 1, 1)(series.to_numpy(dtype=object))
+
+    def _compare(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """Apply the operator elementwise; pairs that cannot be compared count as failures."""
+        compare = self.operators[self.operator]
+        try:
+            return np.asarray(compare(left, right), dtype=bool)
+        except TypeError:
+            pass
+
+        def safe(a, b):
+            try:
+                return bool(compare(a, b))
+            except TypeError:
+                return False
+
+        return np.frompyfunc(safe, 2, 1)(left, right).astype(bool)
+
 
 class CustomCheck(DataFrameCheck):
     """
@@ -195,22 +363,147 @@ class CustomCheck(DataFrameCheck):
 
     Parameters
     ----------
-    function : Callable
-        A function that returns True for valid rows, False otherwise.
+    function : Callable, str or re.Pattern
+        A function that returns True for valid rows, False otherwise. A regular
+        expression (string or compiled pattern) may be given instead, in which
+        case every value of `column` must match it.
     description : str, optional
         Message to include in case of failure.
     raise_on_fail : bool, optional
         Whether failure raises an error or warning.
+    vectorized : bool, optional
+        If True, `function` is called once with the whole DataFrame and must
+        return a boolean array-like (one value per row) instead of being
+        applied row by row.
+    column : str, optional
+        Column matched against `function` when it is a regular expression.
+    thread_safe : bool, optional
+        Whether `function` may be called from a worker thread while other
+        checks run. User functions default to False and always run in the
+        calling thread; regular expressions are always thread-safe.
+    column_arrays : bool, optional
+        If True, each required parameter of `function` names a column
+        (e.g. ``def check(start, end)``) and receives that column as a NumPy
+        array instead of `function` being applied row by row. When it cannot
+        handle arrays (raises TypeError/ValueError or does not return one
+        value per row) it is called element-wise with the column values.
+
+    Raises
+    ------
+    ValueError
+        If a regular expression is given without a `column`, or
+        `column_arrays` is combined with `vectorized` or a regular expression,
+        or given a function whose parameters cannot be passed by name.
     """
-    def __init__(self, function, description: Optional[str] = None, raise_on_fail: bool = True):
+    priority = 200
+    cost_hint = "O(n)"
+
+    def __init__(
+        self,
+        function,
+        description: Optional[str] = None,
+        raise_on_fail: bool = True,
+        vectorized: bool = False,
+        column: Optional[str] = None,
+        thread_safe: bool = False,
+        column_arrays: bool = False
+    ):
         super().__init__(raise_on_fail)
-        self.function = function
         self.description = description or "Custom check failed"
+        self.vectorized = vectorized
+        self.column_arrays = column_arrays
+        self.column = column
+        self.pattern = None
+
+        if isinstance(function, (str, re.Pattern)):
+            if column is None:
+                raise ValueError("A 'column' is required when the custom check is a regular expression.")
+            self.pattern = compile_regex(function) if isinstance(function, str) else function
+            function = self.pattern.match
+
+        self.thread_safe = thread_safe or self.pattern is not None
+        self.function = function
         self.registry_name = get_registry_name(function) if is_registered(function) else None
+        self._column_params = None
+        if column_arrays:
+            if vectorized or self.pattern is not None:
+                raise ValueError("'column_arrays' cannot be combined with 'vectorized' or a regular expression.")
+            self._column_params = self._required_params(function)
+            if self._column_params is None:
+                raise ValueError(
+                    "'column_arrays' requires a function whose required parameters are column names."
+                )
+        self._ufunc = None  # Numba ufunc for scalar column predicates, compiled per input dtypes
+        self._numba_failed = set()  # Input dtype combinations the function could not be compiled for
+
+    @staticmethod
+    def _required_params(function) -> Optional[tuple]:
+        """Return the required parameter names of `function`, if all can be passed positionally or by name."""
+        try:
+            parameters = inspect.signature(function).parameters.values()
+        except (TypeError, ValueError):
+            return None
+        names = []
+        for param in parameters:
+            if param.kind is not param.POSITIONAL_OR_KEYWORD:
+                return None
+            if param.default is param.empty:
+                names.append(param.name)
+        return tuple(names) or None
+
+    def _validate_columns(self, df: pd.DataFrame) -> np.ndarray:
+        """Return a boolean array from calling `function` on column arrays."""
+        n = df.shape[0]
+        arrays = {name: df[name].to_numpy(copy=False) for name in self._column_params}
+        try:
+            valid = np.asarray(self.function(**arrays), dtype=bool)
+            if valid.shape == (n,):
+                return valid
+        except (TypeError, ValueError):
+            pass
+        # Scalar-only predicate: feed it values straight from the column buffers
+        columns = [arrays[name] for name in self._column_params]
+        valid = self._numba_mask(columns)
+        if valid is not None:
+            return valid
+        return np.fromiter(map(self.function, *columns), dtype=bool, count=n)
+
+    def _numba_mask(self, columns: List[np.ndarray]) -> Optional[np.ndarray]:
+        """
+        Evaluate a scalar predicate over numeric columns as a Numba-compiled ufunc.
+
+        Returns None when Numba is not installed, a column's dtype is not one
+        Numba compiles ufuncs for, or the function cannot be compiled for the
+        columns' dtypes (remembered per dtype combination); the caller then
+        falls back to calling the function element by element.
+        """
+        if numba is None or not all(_numba_supports(col.dtype) for col in columns):
+            return None
+        dtypes = tuple(col.dtype for col in columns)
+        if dtypes in self._numba_failed:
+            return None
+        try:
+            if self._ufunc is None:
+                self._ufunc = numba.vectorize(self.function)
+            return np.asarray(self._ufunc(*columns), dtype=bool)
+        except numba.core.errors.NumbaError:
+            self._numba_failed.add(dtypes)
+            return None
+
+    def _validate_pattern(self, df: pd.DataFrame) -> np.ndarray:
+        """Return a boolean array marking values of `column` that match the pattern."""
+        match = self.pattern.match
+        matcher = np.frompyfunc(lambda v: isinstance(v, str) and match(v) is not None, 1, 1)
+        return matcher(df[self.column].to_numpy(dtype=object)).astype(bool)
 
     def validate(self, df: pd.DataFrame) -> dict:
         """
-        Apply the custom function to each row in the DataFrame.
+        Apply the custom function to the DataFrame.
+
+        Row-wise functions are applied to each row; vectorized functions are
+        called once on the whole DataFrame; `column_arrays` functions are
+        called once with their columns; regular expressions are matched
+        against each value of `column` (null and non-string values fail).
 
         Returns
         -------
@@ -220,12 +513,39 @@ class CustomCheck(DataFrameCheck):
         messages = []
         failing_indices = set()
 
-        invalid_mask = ~df.apply(self.function, axis=1)
-        if invalid_mask.any():
-            failing_indices = df[invalid_mask].index
-            messages.append(f"{self.description} (failed on {len(failing_indices)} row(s))")
+        if self.pattern is not None and self.column not in df.columns:
+            messages.append(f"Column '{self.column}' does not exist for custom check.")
+            return {"messages": messages, "failing_indices": failing_indices}
 
-        return {"messages": messages, "failing_indices": set(failing_indices)}
+        if self._column_params is not None:
+            missing = [name for name in self._column_params if name not in self._column_set(df)]
+            if missing:
+                messages.append(f"Columns {missing} do not exist for custom check.")
+                return {"messages": messages, "failing_indices": failing_indices}
+
+        if df.shape[0] == 0:
+            return {"messages": messages, "failing_indices": failing_indices}
+
+        if self.pattern is not None:
+            valid = self._validate_pattern(df)
+        elif self.vectorized:
+            valid = np.asarray(self.function(df), dtype=bool)
+            if valid.shape != (df.shape[0],):
+                raise ValueError(
+                    f"Vectorized custom check must return one boolean per row "
+                    f"(expected {df.shape[0]}, got shape {valid.shape})."
+                )
+        elif self._column_params is not None:
+            valid = self._validate_columns(df)
+        else:
+            valid = df.apply(self.function, axis=1).to_numpy(dtype=bool)
+
+        failed = ~valid
+        if failed.any():
+            failing_indices = FailingIndices.from_mask(df.index, failed)
+            messages.append(f"{self.description} (failed on {failing_indices.count} row(s))")
+
+        return {"messages": messages, "failing_indices": failing_indices}
 
 
 class DefinedColumnsOnlyCheck(DataFrameCheck):
@@ -239,9 +559,12 @@ class DefinedColumnsOnlyCheck(DataFrameCheck):
     raise_on_fail : bool, optional
         Whether failure raises an error or warning.
     """
+    priority = 10
+    cost_hint = "O(ncols)"
+
     def __init__(self, expected_columns: List[str], raise_on_fail: bool = True):
         super().__init__(raise_on_fail)
-        self.expected_columns = set(expected_columns)
+        self.expected_columns = frozenset(expected_columns)
         
     @staticmethod
     def _serialize_defined_columns_check(check) -> dict:
@@ -260,13 +583,18 @@ class DefinedColumnsOnlyCheck(DataFrameCheck):
         dict
             Dict with messages and empty index set.
         """
-        actual = set(df.columns)
-        extra = actual - self.expected_columns
-        messages = []
-        if extra:
-            messages.append(f"Unexpected columns in DataFrame: {sorted(extra)}")
+        messages = self._memoized_column_messages(df, self._column_messages)
         return {"messages": messages, "failing_indices": set()}
 
+    def _column_messages(self, columns: tuple) -> list:
+        expected = self.expected_columns
+        extra = [c for c in columns if c not in expected]
+        if not extra:
+            return []
+        if len(extra) > 1:
+            extra = sorted(set(extra))
+        return [f"Unexpected columns in DataFrame: {extra}"]
+
 
 class ExactColumnsCheck(DataFrameCheck):
     """
@@ -279,9 +607,16 @@ class ExactColumnsCheck(DataFrameCheck):
     raise_on_fail : bool, optional
         Whether failure raises an error or warning.
     """
+    priority = 10
+    cost_hint = "O(ncols)"
+
     def __init__(self, expected_columns: List[str], raise_on_fail: bool = True):
         super().__init__(raise_on_fail)
         self.expected_columns = expected_columns
+        # Interned names hash once and compare by identity against interned labels
+        self._expected_list = [sys.intern(c) if type(c) is str else c for c in expected_columns]
+        self._expected_set = frozenset(self._expected_list)
+        self._expected_index = pd.Index(self._expected_list)
 
     def validate(self, df: pd.DataFrame) -> dict:
         """
@@ -292,15 +627,19 @@ class ExactColumnsCheck(DataFrameCheck):
         dict
             Dict with messages and empty index set.
         """
-        actual_columns = list(df.columns)
-        messages = []
-        failing_indices = set()
+        if df.columns.equals(self._expected_index):
+            return {"messages": [], "failing_indices": set()}
 
-        expected_set = set(self.expected_columns)
-        actual_set = set(actual_columns)
+        messages = self._memoized_column_messages(df, self._column_messages)
+        return {"messages": messages, "failing_indices": set()}
 
-        missing = expected_set - actual_set
-        extra = actual_set - expected_set
+    def _column_messages(self, columns: tuple) -> list:
+        messages = []
+        actual_columns = list(columns)
+        actual_set = frozenset(columns)
+
+        missing = self._expected_set.difference(actual_set)
+        extra = actual_set.difference(self._expected_set)
 
         if missing:
             messages.append(f"Missing column(s): {sorted(missing)}.")
@@ -308,13 +647,13 @@ class ExactColumnsCheck(DataFrameCheck):
         if extra:
             messages.append(f"Unexpected column(s): {sorted(extra)}.")
 
-        if not missing and not extra and actual_columns != self.expected_columns:
+        if not missing and not extra and actual_columns != self._expected_list:
             messages.append(
                 f"Column order mismatch: expected {self.expected_columns}, "
                 f"but got {actual_columns}."
             )
 
-        return {"messages": messages, "failing_indices": failing_indices}
+        return messages
 
 
 class NotEmptyCheck(DataFrameCheck):
@@ -326,12 +665,15 @@ class NotEmptyCheck(DataFrameCheck):
     raise_on_fail : bool, optional
         Whether failure raises an error or warning.
     """
+    priority = 10
+    cost_hint = "O(1)"
+
     def __init__(self, raise_on_fail: bool = True):
         super().__init__(raise_on_fail)
 
     def validate(self, df: pd.DataFrame) -> dict:
         messages = []
-        if df.empty:
+        if 0 in df.shape:
             messages.append("DataFrame is unexpectedly empty.")
         return {"messages": messages, "failing_indices": set()}
 
@@ -345,6 +687,9 @@ class IsEmptyCheck(DataFrameCheck):
     raise_on_fail : bool, optional
         Whether failure raises an error or warning.
     """
+    priority = 10
+    cost_hint = "O(1)"
+
     def __init__(self, raise_on_fail: bool = True):
         super().__init__(raise_on_fail)
 
@@ -358,7 +703,7 @@ class IsEmptyCheck(DataFrameCheck):
             Dict with message and empty index set if failed.
         """
         messages = []
-        if not df.empty:
+        if 0 not in df.shape:
             messages.append("DataFrame is unexpectedly non-empty.")
         return {"messages": messages, "failing_indices": set()}
 
@@ -374,6 +719,9 @@ class NoNullsCheck(DataFrameCheck):
     raise_on_fail : bool, optional
         Whether failure raises an error or warning.
     """
+    priority = 50
+    cost_hint = "O(n)"
+
     def __init__(self, columns: Optional[List[str]] = None, raise_on_fail: bool = True):
         super().__init__(raise_on_fail)
         self.columns = columns
@@ -388,14 +736,35 @@ class NoNullsCheck(DataFrameCheck):
             Dict with messages and failing row indices.
         """
         cols_to_check = self.columns or df.columns.tolist()
-        messages = []
-        failing_indices = set()
 
+        # Work on the raw arrays and fold every column into one row mask. The
+        # mask is allocated per call, and only once a column has nulls, so a
+        # clean pass allocates nothing and concurrent calls share no state.
+        combined = None
+        messages = []
         for col in cols_to_check:
-            if df[col].isna().any():
+            series = df[col]
+            dtype = series.dtype
+            if isinstance(dtype, np.dtype):
+                if dtype.kind in "iub":
+                    continue  # plain integer/bool arrays cannot hold nulls
+                if dtype.kind in "fc":
+                    mask = np.isnan(series.to_numpy(copy=False))
+                else:
+                    mask = pd.isna(series.to_numpy(copy=False))
+            else:
+                mask = pd.isna(series.array)
+            if mask.any():
                 messages.append(f"Column '{col}' contains null values.")
-                failing_indices.update(df[df[col].isna()].index)
+                if combined is None:
+                    combined = np.array(mask, dtype=bool)
+                else:
+                    np.logical_or(combined, mask, out=combined)
 
+        if messages:
+            failing_indices = FailingIndices.from_mask(df.index, combined)
+        else:
+            failing_indices = FailingIndices(df.index, np.empty(0, dtype=np.intp))
         return {"messages": messages, "failing_indices": failing_indices}
 
 
@@ -403,6 +772,9 @@ class UniquenessCheck(DataFrameCheck):
     """
     Ensure rows (or combinations of specified columns) are unique.
 
+    Every row that shares its values with another row is reported as failing,
+    including the first occurrence.
+
     Parameters
     ----------
     columns : list of str, optional
@@ -410,6 +782,9 @@ class UniquenessCheck(DataFrameCheck):
     raise_on_fail : bool, optional
         Whether failure raises an error or warning.
     """
+    priority = 200
+    cost_hint = "O(n log n)"
+
     def __init__(self, columns: Optional[List[str]] = None, raise_on_fail: bool = True):
         super().__init__(raise_on_fail)
         self.columns = columns
@@ -432,18 +807,55 @@ class UniquenessCheck(DataFrameCheck):
                 messages.append(f"Missing columns for uniqueness check: {missing}")
                 return {"messages": messages, "failing_indices": failing_indices}
 
-            duplicates = df[df.duplicated(subset=self.columns)]
-            if not duplicates.empty:
-                messages.append(f"Rows are not unique based on columns: {self.columns}")
-                failing_indices.update(duplicates.index)
+        key_columns = self.columns or df.columns
+        if len(key_columns) == 1:
+            # Single key: one hash pass to integer codes, then count the codes
+            duplicated = self._duplicated_codes(df[key_columns[0]])
+        elif all(self._is_integer_array(df[col]) for col in key_columns):
+            duplicated = self._duplicated_integer_rows(df, list(key_columns))
         else:
-            duplicates = df[df.duplicated()]
-            if not duplicates.empty:
+            duplicated = df.duplicated(subset=self.columns or None, keep=False).to_numpy()
+        if duplicated.any():
+            if self.columns:
+                messages.append(f"Rows are not unique based on columns: {self.columns}")
+            else:
                 messages.append("DataFrame contains duplicate rows.")
-                failing_indices.update(duplicates.index)
 
+        failing_indices = FailingIndices.from_mask(df.index, duplicated)
         return {"messages": messages, "failing_indices": failing_indices}
 
+    @staticmethod
+    def _duplicated_codes(values) -> np.ndarray:
+        """Mask of entries whose value occurs more than once, NaN included."""
+        codes, _ = pd.factorize(values, use_na_sentinel=False)
+        return np.bincount(codes)[codes] > 1
+
+    @staticmethod
+    def _is_integer_array(series: pd.Series) -> bool:
+        """Whether `series` is backed by a NumPy integer or boolean array (no NA possible)."""
+        dtype = series.dtype
+        return isinstance(dtype, np.dtype) and dtype.kind in "iub"
+
+    def _duplicated_integer_rows(self, df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+        """
+        Mask of rows whose integer `columns` match another row's.
+
+        The columns are mixed into one uint64 key so a single 1-D hash pass
+        finds candidate duplicates. Distinct rows can collide on the key, so
+        candidates are confirmed with an exact comparison of their columns.
+        """
+        key = np.zeros(len(df), dtype=np.uint64)
+        for col in columns:
+            key = (key * _KEY_MIX) ^ df[col].to_numpy().astype(np.uint64)
+        candidates = self._duplicated_codes(key)
+        if not candidates.any():
+            return candidates
+        positions = np.flatnonzero(candidates)
+        confirmed = df.iloc[positions].duplicated(subset=columns, keep=False).to_numpy()
+        duplicated = np.zeros(len(df), dtype=bool)
+        duplicated[positions[confirmed]] = True
+        return duplicated
+
 
 class RowCountCheck(DataFrameCheck):
     """
@@ -465,6 +877,9 @@ class RowCountCheck(DataFrameCheck):
     ValueError
         If both 'exact' and ('min' or 'max') are provided.
     """
+    priority = 10
+    cost_hint = "O(1)"
+
     def __init__(
         self,
         exact: Optional[int] = None,
@@ -480,6 +895,15 @@ class RowCountCheck(DataFrameCheck):
         if self.exact is not None and (self.min is not None or self.max is not None):
             raise ValueError("Specify either 'exact' OR 'min'/'max', not both.")
 
+        # Collapse the constraints into one inclusive range for the success path
+        lower = self.exact if self.exact is not None else self.min
+        upper = self.exact if self.exact is not None else self.max
+        self._lower = lower if lower is not None else 0
+        self._upper = upper if upper is not None else sys.maxsize
+        self._exact_message = f"DataFrame must have exactly {self.exact} rows (found {{}})."
+        self._min_message = f"DataFrame must have at least {self.min} rows (found {{}})."
+        self._max_message = f"DataFrame must have at most {self.max} rows (found {{}})."
+
     def validate(self, df: pd.DataFrame) -> dict:
         """
         Validate that the row count meets specified constraints.
@@ -490,20 +914,17 @@ class RowCountCheck(DataFrameCheck):
             Dict with messages and empty failing index set.
         """
         messages = []
-        row_count = len(df)
+        row_count = df.shape[0]
 
-        if self.exact is not None and row_count != self.exact:
-            messages.append(
-                f"DataFrame must have exactly {self.exact} rows (found {row_count})."
-            )
+        if self._lower <= row_count <= self._upper:
+            return {"messages": messages, "failing_indices": set()}
+
+        if self.exact is not None:
+            messages.append(self._exact_message.format(row_count))
 
         if self.min is not None and row_count < self.min:
-            messages.append(
-                f"DataFrame must have at least {self.min} rows (found {row_count})."
-            )
+            messages.append(self._min_message.format(row_count))
 
         if self.max is not None and row_count > self.max:
-            messages.append(
-                f"DataFrame must have at most {self.max} rows (found {row_count})."
-            )
+            messages.append(self._max_message.format(row_count))
         return {"messages": messages, "failing_indices": set()}
@@ -6,8 +6,9 @@ Validation engine for pandas DataFrames using composable column and DataFrame ch
 This module provides the core FrameCheck API, including Schema and ValidationResult
 objects, that allow declarative data validation and rule chaining.
 """
+import numpy as np
 import pandas as pd
-from typing import List, Set, Optional, Dict, Any, Literal
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Set
 import warnings
 
 from framecheck.column_checks import (
@@ -31,10 +32,226 @@ from framecheck.dataframe_checks import (
     UniquenessCheck
 )
 from framecheck.persistence import FrameCheckPersistence
-from framecheck.utilities import CheckFactory
+from framecheck.utilities import PARALLEL_MIN_ROWS, CheckFactory, FailingIndices, map_threaded
 from framecheck.function_registry import get_registered_function, register_check_function
 
 
+# Fewer column checks than this always run sequentially
+_PARALLEL_MIN_COLUMN_CHECKS = 4
+
+
+def _run_column_checks(
+    checks: List,
+    df: pd.DataFrame,
+    fail_fast: bool = False,
+    max_workers: Optional[int] = None
+) -> Iterable[tuple]:
+    """
+    Run column-level checks and pair each check with its result.
+
+    Checks are independent, so on large frames with several checks they run
+    concurrently in a thread pool (except those that are not `thread_safe`);
+    results keep declaration order either way.
+
+    Parameters
+    ----------
+    checks : list
+        Column-level checks, in declaration order.
+    df : pd.DataFrame
+        The DataFrame to validate.
+    fail_fast : bool, default=False
+        If True, checks run one at a time and lazily, so a caller that stops
+        iterating after the first error skips the remaining checks.
+    max_workers : int, optional
+        Maximum number of threads; 1 runs every check in the calling thread.
+        Defaults to one per check, capped at the CPU count.
+
+    Returns
+    -------
+    iterable of tuple
+        ``(check, result)`` pairs in declaration order; `result` is None for
+        checks whose column is missing from `df` (those checks are not run).
+    """
+    columns = _ColumnLookup(df)
+    if fail_fast:
+        return (
+            (check, check.validate(columns[check.column_name]) if check.column_name in df.columns else None)
+            for check in checks
+        )
+
+    present = [i for i, check in enumerate(checks) if check.column_name in df.columns]
+    threaded = [i for i in present if getattr(checks[i], "thread_safe", True)]
+
+    results = [None] * len(checks)
+    if (
+        len(threaded) >= _PARALLEL_MIN_COLUMN_CHECKS
+        and len(df) >= PARALLEL_MIN_ROWS
+        and (max_workers is None or max_workers > 1)
+    ):
+        # Fetch the columns up front so worker threads only read the lookup
+        pairs = [(checks[i], columns[checks[i].column_name]) for i in threaded]
+        outputs = map_threaded(lambda pair: pair[0].validate(pair[1]), pairs, max_workers)
+        for i, output in zip(threaded, outputs):
+            results[i] = output
+        done = set(threaded)
+        present = [i for i in present if i not in done]
+    for i in present:
+        results[i] = checks[i].validate(columns[checks[i].column_name])
+    return list(zip(checks, results))
+
+
+class _ColumnLookup(dict):
+    """
+    Column Series of a DataFrame, extracted once per name.
+
+    Several checks often target the same column (a type check plus flag
+    checks such as ``not_null``); they share one Series instead of each
+    paying for ``df[name]``.
+    """
+    def __init__(self, df: pd.DataFrame):
+        super().__init__()
+        self._df = df
+
+    def __missing__(self, name) -> pd.Series:
+        series = self[name] = self._df[name]
+        return series
+
+
+def _run_dataframe_checks(
+    checks: List,
+    df: pd.DataFrame,
+    has_errors: bool,
+    short_circuit: bool = False,
+    fail_fast: bool = False,
+    max_workers: Optional[int] = None
+) -> List[tuple]:
+    """
+    Run DataFrame-level checks and pair each check with its result.
+
+    Parameters
+    ----------
+    checks : list
+        DataFrame-level checks, in declaration order.
+    df : pd.DataFrame
+        The DataFrame to validate.
+    has_errors : bool
+        Whether column-level validation already produced an error.
+    short_circuit : bool, default=False
+        If True, checks run one at a time in ascending `priority` order and,
+        once an error has been recorded, checks whose `should_run()` returns
+        False are skipped. Otherwise all checks run, concurrently on large
+        frames (see `DataFrameCheck.run_all`).
+    fail_fast : bool, default=False
+        If True, checks run one at a time in ascending `priority` order and
+        none run after the first error.
+    max_workers : int, optional
+        Maximum number of threads used when checks run concurrently.
+
+    Returns
+    -------
+    list of tuple
+        ``(check, result)`` pairs in declaration order; skipped checks are omitted.
+    """
+    if fail_fast and has_errors:
+        return []
+    if not (short_circuit or fail_fast):
+        return list(zip(checks, DataFrameCheck.run_all(checks, df, max_workers)))
+
+    order = sorted(range(len(checks)), key=lambda i: getattr(checks[i], "priority", 100))
+    results = {}
+    for i in order:
+        check = checks[i]
+        should_run = getattr(check, "should_run", None)
+        if has_errors and should_run is not None and not should_run(has_errors):
+            continue
+        result = check.validate(df)
+        results[i] = result
+        if check.raise_on_fail and result.get("messages"):
+            has_errors = True
+            if fail_fast:
+                break
+    return [(checks[i], results[i]) for i in sorted(results)]
+
+
+def _result_mask(result: dict, index: pd.Index) -> Optional[np.ndarray]:
+    """
+    Return a check result's failing rows as a boolean mask aligned with `index`.
+
+    Uses the result's 'failing_mask' when present, the mask behind a
+    FailingIndices otherwise, and falls back to looking up plain label sets.
+    """
+    mask = result.get("failing_mask")
+    if mask is not None:
+        return mask
+    failing = result.get("failing_indices")
+    if not failing:
+        return None
+    if isinstance(failing, FailingIndices) and failing.mask.shape[0] == len(index):
+        return failing.mask
+    return index.isin(list(failing))
+
+
+def _record_result(
+    check,
+    result: dict,
+    index: pd.Index,
+    errors: List[str],
+    warnings_list: List[str],
+    failing_mask: np.ndarray,
+    error_mask: np.ndarray,
+    sample_limit: Optional[int] = None
+) -> None:
+    """
+    Add a check result's messages and failing rows to the running totals.
+
+    When `sample_limit` is set, only the first `sample_limit` failing rows of
+    the check are recorded; 0 records messages only.
+    """
+    if not result.get("messages"):
+        return
+    if sample_limit == 0:
+        mask = None
+    else:
+        mask = _result_mask(result, index)
+        if sample_limit is not None and mask is not None:
+            mask = _truncate_mask(mask, sample_limit)
+    if check.raise_on_fail:
+        errors.extend(result["messages"])
+        if mask is not None:
+            np.logical_or(error_mask, mask, out=error_mask)
+    else:
+        warnings_list.extend(result["messages"])
+    if mask is not None:
+        np.logical_or(failing_mask, mask, out=failing_mask)
+
+
+def _truncate_mask(mask: np.ndarray, limit: int) -> np.ndarray:
+    """Return `mask` with every True after the first `limit` cleared."""
+    cumulative = np.cumsum(mask)
+    if cumulative.shape[0] == 0 or cumulative[-1] <= limit:
+        return mask
+    return mask & (cumulative <= limit)
+
+
+def _build_result(
+    errors: List[str],
+    warnings_list: List[str],
+    index: pd.Index,
+    failing_mask: np.ndarray,
+    error_mask: np.ndarray
+) -> 'ValidationResult':
+    """Create a ValidationResult whose failing rows are backed by the combined masks."""
+    result = ValidationResult(
+        errors=errors,
+        warnings=warnings_list,
+        failing_row_indices=FailingIndices.from_mask(index, failing_mask),
+        failing_mask=failing_mask
+    )
+    result._error_indices = FailingIndices.from_mask(index, error_mask)
+    result._error_mask = error_mask
+    return result
+
+
 class FrameCheckWarning(UserWarning):
     """
     Custom warning class for FrameCheck validation.
@@ -59,16 +276,20 @@ class ValidationResult:
         A list of warning messages generated during validation.
     _failing_row_indices : Set[int], optional
         Indices of rows in the DataFrame that failed validation.
+    _failing_mask : np.ndarray, optional
+        Boolean mask over the validated DataFrame's rows, True for failing rows.
     """
     def __init__(
         self,
         errors: List[str],
         warnings: List[str],
-        failing_row_indices: Optional[Set[int]] = None
+        failing_row_indices: Optional[Set[int]] = None,
+        failing_mask: Optional[np.ndarray] = None
     ):
         self.errors = errors
         self.warnings = warnings
         self._failing_row_indices = failing_row_indices or set()
+        self._failing_mask = failing_mask
 
     @property
     def is_valid(self) -> bool:
@@ -102,7 +323,59 @@ class ValidationResult:
         ------
         ValueError
             If indices cannot be matched to the original DataFrame.
+
+        Notes
+        -----
+        When `df` is the frame that was validated, rows are gathered by
+        position and keep the frame's order; otherwise they are looked up by
+        label in sorted label order.
+        """
+        return df.iloc[self._invalid_positions(df, include_warnings)]
+
+    def iter_invalid_rows(
+        self,
+        df: pd.DataFrame,
+        include_warnings: bool = True,
+        chunk_size: int = 10_000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield the rows that failed validation in chunks of at most `chunk_size` rows.
+
+        Rows are located once, as in `get_invalid_rows`, but only one chunk
+        is copied out of `df` at a time, so memory grows with `chunk_size`
+        rather than with the number of failing rows.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The original DataFrame that was validated.
+        include_warnings : bool, default=True
+            If False, only rows with errors are included.
+        chunk_size : int, default=10_000
+            Maximum number of rows per yielded DataFrame.
+
+        Returns
+        -------
+        Iterator[pd.DataFrame]
+            Consecutive subsets of the invalid rows, in `get_invalid_rows` order.
+
+        Raises
+        ------
+        ValueError
+            If `chunk_size` is not positive or indices cannot be matched to
+            the original DataFrame.
         """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        # Resolved eagerly so unmatched indices raise here, not on first iteration
+        positions = self._invalid_positions(df, include_warnings)
+        return (
+            df.iloc[positions[start:start + chunk_size]]
+            for start in range(0, len(positions), chunk_size)
+        )
+
+    def _invalid_positions(self, df: pd.DataFrame, include_warnings: bool) -> np.ndarray:
+        """Return the positions in `df` of the failing rows (see `get_invalid_rows`)."""
         if not include_warnings:
             if not hasattr(self, "_error_indices"):
                 raise ValueError("Warning-only separation requires internal error tracking. Please update Schema.validate() to support this.")
@@ -110,17 +383,26 @@ class ValidationResult:
         else:
             failing_indices = self._failing_row_indices
 
-        missing = [i for i in failing_indices if i not in df.index]
+        if isinstance(failing_indices, FailingIndices) and (
+            failing_indices.index is df.index or failing_indices.index.equals(df.index)
+        ):
+            if not df.index.is_unique:
+                raise ValueError("DataFrame index must be unique for get_invalid_rows().")
+            return failing_indices.positions
+
+        # One hash-table lookup for all labels; missing labels map to -1
+        positions = df.index.get_indexer_for(sorted(failing_indices))
+        missing = int(np.count_nonzero(positions == -1))
         if missing:
             raise ValueError(
-                f"{len(missing)} of {len(failing_indices)} failing indices not found in provided DataFrame. "
+                f"{missing} of {len(failing_indices)} failing indices not found in provided DataFrame. "
                 "Make sure you're passing the same DataFrame used during validation."
             )
 
         if not df.index.is_unique:
             raise ValueError("DataFrame index must be unique for get_invalid_rows().")
 
-        return df.loc[sorted(failing_indices)]
+        return positions
 
     def summary(self) -> str:
         """
@@ -131,17 +413,16 @@ class ValidationResult:
         str
             Summary of validation outcome, including counts of errors and warnings.
         """
-        lines = [
-            f"Validation {'PASSED' if self.is_valid else 'FAILED'}",
+        sections = [
+            f"Validation {'PASSED' if self.is_valid else 'FAILED'}\n"
             f"{len(self.errors)} error(s), {len(self.warnings)} warning(s)"
         ]
+        # Each list is joined once with the bullet separator instead of formatting every message
         if self.errors:
-            lines.append("Errors:")
-            lines.extend(f"  - {e}" for e in self.errors)
+            sections.append("Errors:\n  - " + "\n  - ".join(self.errors))
         if self.warnings:
-            lines.append("Warnings:")
-            lines.extend(f"  - {w}" for w in self.warnings)
-        return "\n".join(lines)
+            sections.append("Warnings:\n  - " + "\n  - ".join(self.warnings))
+        return "\n".join(sections)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -171,17 +452,34 @@ class Schema:
         A list of column-level checks to apply.
     dataframe_checks : List
         A list of DataFrame-level checks to apply.
+    sample_limit : int, optional
+        Default maximum number of failing rows recorded per check, used when
+        `validate` is not given its own `sample_limit`.
 
     Methods
     -------
     validate(df, verbose=False) -> ValidationResult
         Run all checks on the provided DataFrame and return the result.
     """
-    def __init__(self, column_checks: List, dataframe_checks: List):
+    def __init__(
+        self,
+        column_checks: List,
+        dataframe_checks: List,
+        sample_limit: Optional[int] = None
+    ):
         self.column_checks = column_checks
         self.dataframe_checks = dataframe_checks
+        self.sample_limit = sample_limit
 
-    def validate(self, df: pd.DataFrame, verbose: bool = False) -> ValidationResult:
+    def validate(
+        self,
+        df: pd.DataFrame,
+        verbose: bool = False,
+        short_circuit: bool = False,
+        fail_fast: bool = False,
+        sample_limit: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> ValidationResult:
         """
         Validate a DataFrame using the defined column and DataFrame checks.
 
@@ -191,60 +489,70 @@ class Schema:
             The DataFrame to validate.
         verbose : bool, default=False
             Currently unused.
+        short_circuit : bool, default=False
+            If True, cheap DataFrame checks run first and row-scanning checks
+            are skipped once an error has been recorded.
+        fail_fast : bool, default=False
+            If True, checks run sequentially and validation stops at the first
+            error, so the result holds at most one check's errors.
+        sample_limit : int, optional
+            Maximum number of failing rows recorded per check. When set, the
+            failing row indices are truncated; 0 records messages only.
+            Defaults to the schema's own `sample_limit`.
+        max_workers : int, optional
+            Maximum number of threads used to run checks on large frames;
+            1 runs every check in the calling thread.
 
         Returns
         -------
         ValidationResult
             Object containing error and warning messages from validation.
         """
+        if sample_limit is None:
+            sample_limit = self.sample_limit
         errors = []
         warnings_list = []
-        failing_indices = set()
-        error_indices = set()
+        failing_mask = np.zeros(len(df), dtype=bool)
+        error_mask = np.zeros(len(df), dtype=bool)
+
+        columns = df.columns
+        index = df.index
 
         # Column-level checks
-        for check in self.column_checks:
-            if check.column_name not in df.columns:
+        for check, result in _run_column_checks(self.column_checks, df, fail_fast, max_workers):
+            name = check.column_name
+            if name not in columns:
                 msg = (
-                    f"Column '{check.column_name}' is missing."
-                    if check.__class__.__name__ == "ColumnExistsCheck"
-                    else f"Column '{check.column_name}' does not exist in DataFrame."
+                    f"Column '{name}' is missing."
+                    if isinstance(check, ColumnExistsCheck)
+                    else f"Column '{name}' does not exist in DataFrame."
                 )
                 (errors if check.raise_on_fail else warnings_list).append(msg)
-                continue
-
-            result = check.validate(df[check.column_name])
-            if not isinstance(result, dict):
-                raise TypeError(
-                    f"Validation check for column '{check.column_name}' did not return a dict. Got: {type(result)}"
+            else:
+                if not isinstance(result, dict):
+                    raise TypeError(
+                        f"Validation check for column '{name}' did not return a dict. Got: {type(result)}"
+                    )
+                _record_result(
+                    check, result, index, errors, warnings_list, failing_mask, error_mask, sample_limit
                 )
-
-            if result.get("messages"):
-                if check.raise_on_fail:
-                    errors.extend(result["messages"])
-                    error_indices.update(result["failing_indices"])
-                else:
-                    warnings_list.extend(result["messages"])
-                failing_indices.update(result["failing_indices"])
+            if fail_fast and errors:
+                break
 
         # DataFrame-level checks
-        for df_check in self.dataframe_checks:
-            result = df_check.validate(df)
-            if result.get("messages"):
-                if df_check.raise_on_fail:
-                    errors.extend(result["messages"])
-                    error_indices.update(result["failing_indices"])
-                else:
-                    warnings_list.extend(result["messages"])
-                failing_indices.update(result["failing_indices"])
+        df_results = _run_dataframe_checks(
+            self.dataframe_checks, df, bool(errors), short_circuit, fail_fast, max_workers
+        )
+        for df_check, result in df_results:
+            _record_result(
+                df_check, result, index, errors, warnings_list, failing_mask, error_mask, sample_limit
+            )
 
         # Emit warnings if any
         for msg in warnings_list:
             warnings.warn(msg, FrameCheckWarning)
 
-        result = ValidationResult(errors=errors, warnings=warnings_list, failing_row_indices=failing_indices)
-        result._error_indices = error_indices
-        return result
+        return _build_result(errors, warnings_list, index, failing_mask, error_mask)
 
 
 
@@ -465,21 +773,7 @@ class FrameCheck:
         RuntimeError
             If called after `.only_defined_columns()` was set.
         """
-        if self._finalized:
-            raise RuntimeError("Cannot call .column() after .only_defined_columns()")
-        col_type = kwargs.pop('type', None)
-        raise_on_fail = not kwargs.pop('warn_only', False)
-        if col_type is None and not kwargs:
-            self._column_checks.append(ColumnExistsCheck(name, raise_on_fail))
-            return self
-        
-        checks = CheckFactory.create(
-            col_type, column_name=name, raise_on_fail=raise_on_fail, **kwargs
-        )
-        if not isinstance(checks, list):
-            checks = [checks]
-        self._column_checks.extend(checks)
-        return self
+        return self.columns([name], **kwargs)
 
     def columns(self, names: List[str], **kwargs) -> 'FrameCheck':
         """
@@ -496,9 +790,23 @@ class FrameCheck:
         -------
         FrameCheck
             The updated FrameCheck instance.
+
+        Raises
+        ------
+        RuntimeError
+            If called after `.only_defined_columns()` was set.
         """
-        for name in names:
-            self.column(name, **kwargs)
+        if self._finalized:
+            raise RuntimeError("Cannot call .column() after .only_defined_columns()")
+        col_type = kwargs.pop('type', None)
+        raise_on_fail = not kwargs.pop('warn_only', False)
+        if col_type is None and not kwargs:
+            self._column_checks.extend(ColumnExistsCheck(name, raise_on_fail) for name in names)
+            return self
+
+        self._column_checks.extend(CheckFactory.create_many(
+            col_type, list(names), raise_on_fail=raise_on_fail, **kwargs
+        ))
         return self
 
     def columns_are(self, expected_columns: List[str], warn_only: bool = False) -> 'FrameCheck':
@@ -590,17 +898,39 @@ class FrameCheck:
         return self
     
     
-    def custom_check(self, function, description: Optional[str] = None) -> 'FrameCheck':
-        """
+    def custom_check(
+        self,
+        function,
+        description: Optional[str] = None,
+        vectorized: bool = False,
+        column: Optional[str] = None,
+        thread_safe: bool = False,
+        column_arrays: bool = False
+    ) -> 'FrameCheck':
+        r"""
         Add a custom user-defined validation function.
     
         Parameters
         ----------
-        function : Callable
+        function : Callable, str or re.Pattern
             A function that returns True for valid rows, False otherwise.
             For persistence across sessions, use @register_check_function decorator.
+            A regular expression may be given instead, together with `column`.
         description : str, optional
             Description of the custom check.
+        vectorized : bool, optional
+            If True, `function` receives the whole DataFrame and must return one
+            boolean per row. This avoids calling the function once per row.
+        column : str, optional
+            Column whose values must match `function` when it is a regular expression.
+        thread_safe : bool, optional
+            If True, `function` may run on a worker thread concurrently with
+            other checks on large DataFrames. By default it runs in the
+            calling thread.
+        column_arrays : bool, optional
+            If True, each required parameter of `function` names a column and
+            receives that column as a NumPy array, so the function is called
+            once instead of once per row.
     
         Returns
         -------
@@ -612,6 +942,15 @@ class FrameCheck:
         >>> # Using a lambda (not serializable)
         >>> check = FrameCheck().custom_check(lambda row: row['age'] >= 18, "Must be adult")
         >>>
+        >>> # Using a vectorized lambda
+        >>> check = FrameCheck().custom_check(lambda df: df['age'] >= 18, "Must be adult", vectorized=True)
+        >>>
+        >>> # Parameters named after columns receive whole column arrays
+        >>> check = FrameCheck().custom_check(lambda start, end: start <= end, "Start after end", column_arrays=True)
+        >>>
+        >>> # Using a regular expression (serializable)
+        >>> check = FrameCheck().custom_check(r'^\d{5}$', "Invalid ZIP code", column='zip')
+        >>>
         >>> # Using a registered function (serializable)
         >>> @register_check_function()
         >>> def valid_age(row):
@@ -619,11 +958,25 @@ class FrameCheck:
         >>>
         >>> check = FrameCheck().custom_check(valid_age, "Must be adult")
         """
-        self._dataframe_checks.append(CustomCheck(function=function, description=description))
+        self._dataframe_checks.append(
+            CustomCheck(
+                function=function,
+                description=description,
+                vectorized=vectorized,
+                column=column,
+                thread_safe=thread_safe,
+                column_arrays=column_arrays
+            )
+        )
         return self
     
     
-    def registered_check(self, function_name: str, description: Optional[str] = None) -> 'FrameCheck':
+    def registered_check(
+        self,
+        function_name: str,
+        description: Optional[str] = None,
+        vectorized: bool = False
+    ) -> 'FrameCheck':
         """
         Add a custom check using a registered function name.
     
@@ -633,6 +986,8 @@ class FrameCheck:
             Name of a registered function.
         description : str, optional
             Description of the custom check.
+        vectorized : bool, optional
+            If True, the function receives the whole DataFrame instead of one row.
     
         Returns
         -------
@@ -648,10 +1003,17 @@ class FrameCheck:
         if not func:
             raise ValueError(f"No registered function found with name '{function_name}'")
         
-        return self.custom_check(func, description)
+        return self.custom_check(func, description, vectorized=vectorized)
         
     
-    def validate(self, df: pd.DataFrame) -> ValidationResult:
+    def validate(
+        self,
+        df: pd.DataFrame,
+        short_circuit: bool = False,
+        fail_fast: bool = False,
+        sample_limit: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> ValidationResult:
         """
         Run all defined checks against the provided DataFrame.
 
@@ -659,6 +1021,22 @@ class FrameCheck:
         ----------
         df : pandas.DataFrame
             The DataFrame to validate.
+        short_circuit : bool, default=False
+            If True, cheap DataFrame-level checks (row count, column layout) run
+            first and row-scanning checks such as uniqueness or custom checks
+            are skipped once an error has been recorded. Use this when only
+            the pass/fail verdict matters.
+        fail_fast : bool, default=False
+            If True, checks run sequentially and validation stops at the first
+            error, so the result holds at most one check's errors.
+        sample_limit : int, optional
+            Maximum number of failing rows recorded per check. When set,
+            `get_invalid_rows()` returns a truncated sample; 0 records
+            messages only.
+        max_workers : int, optional
+            Maximum number of threads used to run checks on large frames;
+            1 runs every check in the calling thread. Defaults to one per
+            check, capped at the CPU count.
 
         Returns
         -------
@@ -671,50 +1049,48 @@ class FrameCheck:
             If `raise_on_error()` was set and validation fails.
         """
         if self._finalized:
-            expected_cols = [check.column_name for check in self._column_checks if hasattr(check, 'column_name')]
             # Check if a DefinedColumnsOnlyCheck already exists
             has_defined_cols_check = any(
                 isinstance(check, DefinedColumnsOnlyCheck) 
                 for check in self._dataframe_checks
             )
-            # Only add if one doesn't exist yet
+            # Only add if one doesn't exist yet; its expected names are hashed once here
             if not has_defined_cols_check:
+                expected_cols = [check.column_name for check in self._column_checks if hasattr(check, 'column_name')]
                 self._dataframe_checks.append(DefinedColumnsOnlyCheck(expected_columns=expected_cols))
 
         errors = []
         warnings_list = []
-        failing_indices = set()
-        error_indices = set()
+        failing_mask = np.zeros(len(df), dtype=bool)
+        error_mask = np.zeros(len(df), dtype=bool)
+
+        columns = df.columns
+        index = df.index
 
-        for check in self._column_checks:
-            if check.column_name not in df.columns:
-                msg = f"Column '{check.column_name}' is missing."
+        for check, result in _run_column_checks(self._column_checks, df, fail_fast, max_workers):
+            name = check.column_name
+            if name not in columns:
+                msg = f"Column '{name}' is missing."
                 (errors if check.raise_on_fail else warnings_list).append(msg)
-                continue
-            result = check.validate(df[check.column_name])
-            if result.get("messages"):
-                if check.raise_on_fail:
-                    errors.extend(result["messages"])
-                    error_indices.update(result["failing_indices"])
-                else:
-                    warnings_list.extend(result["messages"])
-                failing_indices.update(result["failing_indices"])
-
-        for df_check in self._dataframe_checks:
-            result = df_check.validate(df)
-            if result.get("messages"):
-                if df_check.raise_on_fail:
-                    errors.extend(result["messages"])
-                    error_indices.update(result["failing_indices"])
-                else:
-                    warnings_list.extend(result["messages"])
-                failing_indices.update(result["failing_indices"])
+            else:
+                _record_result(
+                    check, result, index, errors, warnings_list, failing_mask, error_mask, sample_limit
+                )
+            if fail_fast and errors:
+                break
+
+        df_results = _run_dataframe_checks(
+            self._dataframe_checks, df, bool(errors), short_circuit, fail_fast, max_workers
+        )
+        for df_check, result in df_results:
+            _record_result(
+                df_check, result, index, errors, warnings_list, failing_mask, error_mask, sample_limit
+            )
 
         # Emit warnings to logger or warnings system
         self._emit_warnings(warnings_list)
         
-        result = ValidationResult(errors=errors, warnings=warnings_list, failing_row_indices=failing_indices)
-        result._error_indices = error_indices
+        result = _build_result(errors, warnings_list, index, failing_mask, error_mask)
         
         if self._raise_on_error and errors:
             raise ValueError("FrameCheck validation failed:\n" + "\n".join(errors))
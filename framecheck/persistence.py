@@ -9,11 +9,13 @@ allowing validation rules to be saved, shared, and reused.
 
 import json
 import os
+import re
 from datetime import datetime
 import warnings
 from typing import Dict, Any, Optional, List, Type
 from framecheck.function_registry import is_registered, get_registry_name, get_registered_function
 from framecheck.dataframe_checks import CustomCheck, DefinedColumnsOnlyCheck
+from framecheck.utilities import compile_regex
 
 
 class FrameCheckPersistence:
@@ -141,6 +143,10 @@ class FrameCheckPersistence:
         result = {}
         if hasattr(check, "regex"):
             result["regex"] = check.regex
+            pattern = getattr(check, "_pattern", None)
+            if isinstance(pattern, re.Pattern) and pattern.flags & ~re.UNICODE:
+                # Flags of a precompiled pattern are not part of its source
+                result["flags"] = pattern.flags
         if hasattr(check, "in_set"):
             result["in_set"] = check.in_set
         if hasattr(check, "not_in_set"):
@@ -237,6 +243,17 @@ class FrameCheckPersistence:
         # Add registry_name if available
         if hasattr(check, "registry_name") and check.registry_name is not None:
             result["registry_name"] = check.registry_name
+
+        if getattr(check, "vectorized", False):
+            result["vectorized"] = True
+        if getattr(check, "column_arrays", False):
+            result["column_arrays"] = True
+
+        # Regular expression checks can be restored without a registered function
+        if getattr(check, "pattern", None) is not None:
+            result["pattern"] = check.pattern.pattern
+            result["flags"] = check.pattern.flags
+            result["column"] = check.column
             
         return result
     
@@ -388,6 +405,8 @@ class FrameCheckPersistence:
             kwargs = {}
             if "regex" in check_data:
                 kwargs["regex"] = check_data["regex"]
+                if check_data.get("flags"):
+                    kwargs["regex"] = compile_regex(check_data["regex"], check_data["flags"])
             if "in_set" in check_data and "equals" not in check_data:
                 # Only set in_set if equals is not present
                 kwargs["in_set"] = check_data["in_set"]
@@ -516,13 +535,23 @@ class FrameCheckPersistence:
         elif check_type == "CustomCheck":
             description = check_data.get("description", "Custom check")
             registry_name = check_data.get("registry_name")
-            
-            if registry_name:
+            vectorized = check_data.get("vectorized", False)
+            pattern = check_data.get("pattern")
+            
+            if pattern is not None:
+                frame_check.custom_check(
+                    function=compile_regex(pattern, check_data.get("flags", 0)),
+                    description=description,
+                    column=check_data.get("column")
+                )
+            elif registry_name:
                 func = get_registered_function(registry_name)
                 if func:
                     frame_check.custom_check(
                         function=func,
-                        description=description
+                        description=description,
+                        vectorized=vectorized,
+                        column_arrays=check_data.get("column_arrays", False)
                     )
                 else:
                     warnings.warn(
@@ -4,10 +4,213 @@ utilities.py
 Utility module for registering and instantiating column validation checks.
 
 Defines a CheckFactory class that allows dynamic creation of column check instances
-based on a registry of check types.
+based on a registry of check types, the FailingIndices container that checks
+use to report failing rows, and small helpers shared by the validation engine.
 """
 
+from collections.abc import Set
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from inspect import signature
+import os
+import re
+import numpy as np
+import pandas as pd
+
+try:
+    import re2
+except ImportError:  # optional dependency
+    re2 = None
+
+
+@lru_cache(maxsize=512)
+def compile_regex(pattern: str, flags: int = 0) -> re.Pattern:
+    """
+    Compile a regular expression, reusing previously compiled patterns.
+
+    Parameters
+    ----------
+    pattern : str
+        Regular expression to compile.
+    flags : int, optional
+        Flags passed to ``re.compile``.
+
+    Returns
+    -------
+    re.Pattern
+        The compiled pattern.
+    """
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=512)
+def compile_match_regex(pattern: str):
+    """
+    Compile a regular expression used only for matching, preferring RE2.
+
+    RE2 (``google-re2``) matches in linear time. When it is not installed, or
+    the pattern uses features RE2 does not support (backreferences,
+    lookaround), the standard ``re`` compiler is used instead.
+
+    Parameters
+    ----------
+    pattern : str
+        Regular expression to compile.
+
+    Returns
+    -------
+    object
+        A compiled pattern exposing ``match(string)``.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return compile_regex(pattern)
+
+
+# Below this many rows, thread start-up costs more than the checks themselves
+PARALLEL_MIN_ROWS = 10_000
+
+
+def map_threaded(function, items: list, max_workers: int = None) -> list:
+    """
+    Call `function` on each item using a thread pool.
+
+    Validation work is dominated by pandas/NumPy routines that release the
+    GIL, so independent checks overlap well on threads.
+
+    Parameters
+    ----------
+    function : Callable
+        Function applied to each item.
+    items : list
+        Inputs, one call each.
+    max_workers : int, optional
+        Maximum number of threads. Defaults to ``min(len(items), os.cpu_count())``.
+
+    Returns
+    -------
+    list
+        Results in the same order as `items`.
+    """
+    if max_workers is None:
+        max_workers = min(len(items), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        return list(executor.map(function, items))
+
+
+class FailingIndices(Set):
+    """
+    Read-only set of failing row labels backed by NumPy row positions.
+
+    Checks locate failing rows with vectorized masks; this container keeps the
+    mask (or the positions derived from it) and only builds Python objects
+    (labels, a hash set) when a caller iterates or tests membership. Callers
+    that only need a count get it from the mask without materializing labels.
+    It compares equal to a regular ``set`` holding the same labels.
+
+    Parameters
+    ----------
+    index : pd.Index
+        Index of the validated Series or DataFrame.
+    positions : np.ndarray
+        Integer positions of the failing rows within `index`.
+    """
+    __slots__ = ("_index", "_positions", "_mask", "_labels", "_label_list")
+
+    def __init__(self, index: pd.Index, positions: np.ndarray):
+        self._index = index
+        self._positions = positions
+        self._mask = None
+        self._labels = None
+        self._label_list = None
+
+    @classmethod
+    def from_mask(cls, index: pd.Index, mask: np.ndarray) -> "FailingIndices":
+        """
+        Build from a boolean mask aligned with `index`; positions are computed on demand.
+
+        Parameters
+        ----------
+        index : pd.Index
+            Index of the validated Series or DataFrame.
+        mask : np.ndarray
+            Boolean array, True for failing rows.
+
+        Returns
+        -------
+        FailingIndices
+        """
+        failing = cls(index, None)
+        failing._mask = mask
+        return failing
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return frozenset(iterable)
+
+    @property
+    def index(self) -> pd.Index:
+        """Index of the validated Series or DataFrame the positions refer to."""
+        return self._index
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Integer positions of the failing rows."""
+        if self._positions is None:
+            self._positions = np.flatnonzero(self._mask)
+        return self._positions
+
+    @property
+    def mask(self) -> np.ndarray:
+        """Boolean mask over the index, True for failing rows."""
+        if self._mask is None:
+            mask = np.zeros(len(self._index), dtype=bool)
+            mask[self._positions] = True
+            self._mask = mask
+        return self._mask
+
+    @property
+    def count(self) -> int:
+        """Number of failing rows (positions, not distinct labels)."""
+        if self._positions is None:
+            return int(np.count_nonzero(self._mask))
+        return int(self._positions.size)
+
+    def _labels_at_positions(self) -> list:
+        if self._label_list is None:
+            index = self._index
+            dtype = index.dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in "iufbO":
+                # Slice the backing array; avoids building an intermediate Index
+                self._label_list = index.to_numpy(copy=False)[self.positions].tolist()
+            else:
+                self._label_list = index[self.positions].tolist()
+        return self._label_list
+
+    def _label_set(self) -> frozenset:
+        if self._labels is None:
+            self._labels = frozenset(self._labels_at_positions())
+        return self._labels
+
+    def __contains__(self, label) -> bool:
+        return label in self._label_set()
+
+    def __iter__(self):
+        if self._index.is_unique:
+            return iter(self._labels_at_positions())
+        return iter(self._label_set())
+
+    def __len__(self) -> int:
+        if self._index.is_unique:
+            return self.count
+        return len(self._label_set())
+
+    def __repr__(self) -> str:
+        return f"FailingIndices({set(self)!r})"
+
 
 class CheckFactory:
     """
@@ -66,16 +269,41 @@ class CheckFactory:
         ValueError
             If the check type is unknown or if invalid keyword arguments are provided.
         """
-        instances = []
+        instances = cls.create_many(check_type, [column_name], raise_on_fail, **kwargs)
+        return instances if len(instances) > 1 else instances[0]
+
+    @classmethod
+    def create_many(cls, check_type: str, column_names: list, raise_on_fail: bool, **kwargs) -> list:
+        """
+        Instantiate the same checks for several columns, resolving kwargs only once.
+
+        Parameters
+        ----------
+        check_type : str
+            The primary check type to instantiate (e.g., 'int', 'string').
+        column_names : list of str
+            Names of the columns the checks apply to.
+        raise_on_fail : bool
+            Whether to treat violations as errors.
+        **kwargs : dict
+            Additional keyword arguments to pass to the check class or flag-based checks.
 
+        Returns
+        -------
+        list
+            Check instances, grouped by column in the order of `column_names`.
+
+        Raises
+        ------
+        ValueError
+            If the check type is unknown or if invalid keyword arguments are provided.
+        """
         check_cls = cls.registry.get(check_type)
         if not check_cls:
             raise ValueError(f"Unknown column type '{check_type}'")
 
-        # Grab init args for the check class
-        init_params = signature(check_cls.__init__).parameters
-        valid_keys = set(init_params.keys()) - {'self'}
-        invalid_keys = set(kwargs) - valid_keys - set(cls.registry.keys())
+        valid_keys = cls._init_keys(check_cls)
+        invalid_keys = set(kwargs) - valid_keys - cls.registry.keys()
 
         if invalid_keys:
             raise ValueError(
@@ -84,16 +312,23 @@ class CheckFactory:
 
         # Separate kwargs for main class and extra flags
         main_kwargs = {k: v for k, v in kwargs.items() if k in valid_keys}
-        instances.append(check_cls(column_name=column_name, raise_on_fail=raise_on_fail, **main_kwargs))
-
-        # Handle additional flag-based checks
-        remaining_flags = {
-            k: v for k, v in kwargs.items()
+        extra_classes = [
+            cls.registry[k] for k, v in kwargs.items()
             if k not in valid_keys and k in cls.registry and v is True
-        }
+        ]
 
-        for flag_name in remaining_flags:
-            extra_cls = cls.registry[flag_name]
-            instances.append(extra_cls(column_name=column_name, raise_on_fail=raise_on_fail))
+        return [
+            instance
+            for column_name in column_names
+            for instance in (
+                check_cls(column_name=column_name, raise_on_fail=raise_on_fail, **main_kwargs),
+                *(extra_cls(column_name=column_name, raise_on_fail=raise_on_fail)
+                  for extra_cls in extra_classes)
+            )
+        ]
 
-        return instances if len(instances) > 1 else instances[0]
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _init_keys(check_cls: type) -> frozenset:
+        """Return the keyword names accepted by `check_cls.__init__`, excluding `self`."""
+        return frozenset(signature(check_cls.__init__).parameters) - {'self'}
@@ -1,17 +1,88 @@
+import logging
+import os
+
 from setuptools import setup, find_packages
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, ExecError, PlatformError
+
+
+log = logging.getLogger("framecheck.build")
+
+
+def optional_extensions():
+    """
+    Compile the DataFrame check module with Cython when it is available.
+
+    Cython is a build requirement (pyproject.toml), so isolated builds compile
+    the module. The module is plain Python, so the compiled extension is a
+    drop-in replacement; without Cython (or with FRAMECHECK_NO_CYTHON set) the
+    package installs as pure Python.
+    """
+    if os.environ.get("FRAMECHECK_NO_CYTHON"):
+        return []
+    try:
+        from Cython.Build import cythonize
+        from Cython.Compiler.Errors import CompileError
+    except ImportError:
+        log.warning("Cython is not installed; building framecheck as pure Python.")
+        return []
+    try:
+        return cythonize(
+            ["framecheck/dataframe_checks.py"],
+            compiler_directives={
+                "language_level": "3",
+                "binding": True,
+                "boundscheck": False,
+                "wraparound": False,
+                "annotation_typing": False,
+            },
+            quiet=True,
+        )
+    except CompileError as exc:
+        log.warning("Cython could not translate dataframe_checks.py (%s); building as pure Python.", exc)
+        return []
+
+
+class OptionalBuildExt(build_ext):
+    """
+    Build extensions if possible, falling back to pure Python when no working
+    C compiler is available. Other errors are not swallowed.
+    """
+
+    def run(self):
+        try:
+            super().run()
+        except PlatformError as exc:
+            log.warning("No C compiler available, skipping compiled extensions: %s", exc)
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except (CCompilerError, ExecError, PlatformError) as exc:
+            log.warning("Failed to compile %s, using the pure-Python module: %s", ext.name, exc)
+
 
 setup(
     name="framecheck",
     version="0.5.1",
     packages=find_packages(),
+    exclude_package_data={"framecheck": ["*.c"]},
+    ext_modules=optional_extensions(),
+    cmdclass={"build_ext": OptionalBuildExt},
     install_requires=[
-        "pandas"
+        "pandas>=1.5"
     ],
     extras_require={
         "dev": [
             "pytest",
             "pytest-cov",
             "pytest-html"
+        ],
+        "re2": [
+            "google-re2"
+        ],
+        "numba": [
+            "numba"
         ]
     },
     author="Nick Olivier",
@@ -0,0 +1,70 @@
+"""Unit tests for accessor.py"""
+import logging
+import unittest
+import pandas as pd
+from framecheck import FrameCheck
+
+
+class TestFrameCheckAccessor(unittest.TestCase):
+    """
+    Test suite for the DataFrame.framecheck accessor, verifying results are
+    cached per DataFrame and invalidated when the checks or options change.
+    """
+    def setUp(self):
+        self.df = pd.DataFrame({'a': [1, 2, 3]})
+        self.check = FrameCheck().column('a', type='int', max=2)
+
+    def test_repeated_validation_reuses_result(self):
+        """Test validating the same DataFrame twice returns the cached result."""
+        first = self.df.framecheck.validate(self.check)
+        self.assertFalse(first.is_valid)
+        self.assertIs(self.df.framecheck.validate(self.check), first)
+
+    def test_copies_start_with_empty_cache(self):
+        """Test a copied DataFrame is validated afresh."""
+        first = self.df.framecheck.validate(self.check)
+        self.assertIsNot(self.df.copy().framecheck.validate(self.check), first)
+
+    def test_adding_checks_invalidates_cache(self):
+        """Test adding a check to the FrameCheck triggers revalidation."""
+        first = self.df.framecheck.validate(self.check)
+        self.check.row_count(5)
+        second = self.df.framecheck.validate(self.check)
+        self.assertIsNot(second, first)
+        self.assertEqual(len(second.errors), 2)
+
+    def test_only_defined_columns_invalidates_cache(self):
+        """Test restricting a FrameCheck to its defined columns triggers revalidation."""
+        df = pd.DataFrame({'a': [1, 2], 'extra': [3, 4]})
+        check = FrameCheck(log_errors=False).column('a', type='int')
+        self.assertTrue(df.framecheck.validate(check).is_valid)
+        check.only_defined_columns()
+        result = df.framecheck.validate(check)
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.errors, ["Unexpected columns in DataFrame: ['extra']"])
+        self.assertIs(df.framecheck.validate(check), result)
+
+    def test_logging_settings_invalidate_cache(self):
+        """Test changing where messages are reported triggers revalidation."""
+        first = self.df.framecheck.validate(self.check)
+        self.check._logger = logging.getLogger('framecheck.test_accessor')
+        with self.assertLogs('framecheck.test_accessor'):
+            self.assertIsNot(self.df.framecheck.validate(self.check), first)
+
+    def test_refresh_and_options_bypass_cache(self):
+        """Test refresh=True and different validate options run validation again."""
+        first = self.df.framecheck.validate(self.check)
+        self.assertIsNot(self.df.framecheck.validate(self.check, refresh=True), first)
+        self.assertIsNot(self.df.framecheck.validate(self.check, short_circuit=True), first)
+
+    def test_raise_on_error_is_not_cached_away(self):
+        """Test a FrameCheck that raises keeps raising on repeated validation."""
+        self.df.framecheck.validate(self.check)
+        self.check.raise_on_error()
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.df.framecheck.validate(self.check)
+
+
+if __name__ == '__main__':
+    unittest.main()
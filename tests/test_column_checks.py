@@ -1,9 +1,15 @@
 """Unit tests for column_checks.py"""
+import re
 import unittest
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
 import pandas as pd
 import numpy as np
 from decimal import Decimal
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
 
 from framecheck.column_checks import (
     IntColumnCheck,
@@ -39,6 +45,12 @@ class TestBoolColumnCheck(unittest.TestCase):
         self.assertTrue(result['failing_indices'])
         self.assertEqual(len(result['failing_indices']), 4)
 
+    def test_object_column_requires_python_bools(self):
+        """Test object columns accept only Python bools, not values equal to them."""
+        series = pd.Series([True, 1, None, 0.0, False], dtype=object)
+        result = BoolColumnCheck('subscribed').validate(series)
+        self.assertEqual(result['failing_indices'], {1, 3})
+
     def test_all_valid_booleans(self):
         """Test passes when all values are valid booleans."""
         series = pd.Series([True, False, True])
@@ -47,6 +59,19 @@ class TestBoolColumnCheck(unittest.TestCase):
         self.assertEqual(result['messages'], [])
         self.assertEqual(result['failing_indices'], set())
         
+    def test_numeric_dtype_values_are_not_boolean(self):
+        """Test non-null values of a numeric column are reported as non-boolean."""
+        series = pd.Series([1.0, None, 0.0])
+        result = BoolColumnCheck('flag').validate(series)
+        self.assertEqual(result['failing_indices'], {0, 2})
+
+    def test_nullable_dtypes(self):
+        """Test nullable numeric columns fail on non-null values while nullable booleans pass."""
+        result = BoolColumnCheck('flag').validate(pd.Series([1, None, 0], dtype='Int64'))
+        self.assertEqual(result['failing_indices'], {0, 2})
+        result = BoolColumnCheck('flag').validate(pd.Series([True, None], dtype='boolean'))
+        self.assertEqual(result['failing_indices'], set())
+
     def test_equals(self):
         """Test fails when values do not match the equals constraint."""
         series = pd.Series([True, False, True])
@@ -124,6 +149,13 @@ class TestDatetimeColumnCheck(unittest.TestCase):
         self.assertTrue(any('before' in m for m in result['messages']))
         self.assertIn(0, result['failing_indices'])
 
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_arrow_timestamp_bounds_ignore_nulls(self):
+        """Test bounds on an Arrow timestamp column treat nulls as passing."""
+        data = pd.Series(['2024-01-01', None, '2025-01-01'], dtype='timestamp[ns][pyarrow]')
+        result = DatetimeColumnCheck(self.col, min='2024-06-01').validate(data)
+        self.assertEqual(result['failing_indices'], {0})
+
     def test_equals_invalid_datetime(self):
         """Test fails when values do not match equals constraint or are invalid dates."""
         series = pd.Series(['2024-01-01', '2024-01-02', 'invalid'])
@@ -169,11 +201,43 @@ class TestDatetimeColumnCheck(unittest.TestCase):
 
     def test_inconsistent_type_warning(self):
         """Test warning is returned when mixed datetime types are used."""
-        series = pd.Series(['2024-01-01', pd.Timestamp('2024-01-02')])
+        # dtype=object: older pandas would otherwise coerce the values to datetime64
+        series = pd.Series(['2024-01-01', pd.Timestamp('2024-01-02')], dtype=object)
         check = DatetimeColumnCheck(self.col)
         result = check.validate(series)
         self.assertTrue(any('inconsistent datetime types' in m.lower() for m in result['messages']))
 
+    def test_inconsistent_types_listed_in_order(self):
+        """Test the inconsistent-type message names the first distinct types, skipping nulls."""
+        series = pd.Series([None, '2024-01-01', pd.Timestamp('2024-01-02'), '2024-01-03', datetime(2024, 1, 4), 5])
+        result = DatetimeColumnCheck(self.col).validate(series)
+        self.assertIn(
+            "Column 'created_at' contains inconsistent datetime types: ['str', 'Timestamp', 'datetime'].",
+            result['messages']
+        )
+
+    def test_mixed_categorical_types_reported(self):
+        """Test typed columns are homogeneous, while categoricals are still scanned."""
+        tz_aware = pd.Series(pd.date_range('2024-01-01', periods=3, tz='UTC'))
+        self.assertEqual(DatetimeColumnCheck(self.col).validate(tz_aware)['messages'], [])
+        mixed = pd.Series(pd.Categorical(pd.array(['2024-01-01', pd.Timestamp('2024-01-02')], dtype=object)))
+        result = DatetimeColumnCheck(self.col).validate(mixed)
+        self.assertTrue(any('inconsistent datetime types' in m for m in result['messages']))
+
+    def test_equals_on_typed_column_flags_other_dates_and_nulls(self):
+        """Test 'equals' on a datetime64 column flags differing dates and NaT, as for strings."""
+        series = pd.Series(pd.to_datetime(['2024-01-01', '2024-01-02', None]))
+        result = DatetimeColumnCheck(self.col, equals='2024-01-01').validate(series)
+        self.assertEqual(result['failing_indices'], {1, 2})
+
+    def test_datetime64_bounds_on_typed_column(self):
+        """Test bounds are applied to a datetime64 column, with NaT ignored."""
+        series = pd.Series(pd.to_datetime(['2024-01-01', None, '2024-03-01']))
+        check = DatetimeColumnCheck(self.col, min='2024-02-01', before='2024-02-15')
+        result = check.validate(series)
+        self.assertEqual(len(result['messages']), 2)
+        self.assertEqual(result['failing_indices'], {0, 2})
+
     def test_invalid_bound_format_error(self):
         """Test raises ValueError when bound cannot be parsed using format."""
         with self.assertRaises(ValueError):
@@ -241,6 +305,21 @@ class TestDatetimeColumnCheck(unittest.TestCase):
         check = DatetimeColumnCheck(self.col, after='yesterday')
         self.assertIsNotNone(check.after)
 
+    def test_relative_bounds_follow_date_rollover(self):
+        """Test 'today'-style bounds are re-resolved when validating on a later day."""
+        class NextDay(date):
+            @classmethod
+            def today(cls):
+                return date.today() + timedelta(days=1)
+
+        check = DatetimeColumnCheck(self.col, after='today', before='tomorrow')
+        data = pd.Series([datetime.today().strftime('%Y-%m-%d')])
+        self.assertEqual(check.validate(data)['messages'], [])
+        with patch('framecheck.column_checks.date', NextDay):
+            result = check.validate(data)
+        self.assertTrue(any('after' in m for m in result['messages']))
+        self.assertEqual(check.before, datetime.fromordinal(date.today().toordinal() + 2))
+
     def test_tomorrow_bound(self):
         """Test passes when value is before tomorrow."""
         tomorrow = datetime.today() + timedelta(days=1)
@@ -286,6 +365,41 @@ class TestFloatColumnCheck(unittest.TestCase):
         self.assertTrue(any('not numeric' in m for m in result['messages']))
         self.assertEqual(len(result['failing_indices']), 3)
 
+    def test_object_column_of_numbers_and_nulls(self):
+        """Test object columns holding only numbers and nulls pass the type check and keep bounds."""
+        series = pd.Series([1, 2.5, Decimal('3'), None, np.nan], dtype=object)
+        result = FloatColumnCheck('score', max=2).validate(series)
+        self.assertEqual(result['messages'], ["Column 'score' has values greater than 2."])
+        self.assertEqual(result['failing_indices'], {1, 2})
+
+    def test_typed_numeric_column_bounds(self):
+        """Test numeric-dtype columns skip the type scan but still enforce bounds and infinity."""
+        series = pd.Series([0.5, np.inf, -1.0, np.nan])
+        result = FloatColumnCheck('score', min=0).validate(series)
+        self.assertIn("Column 'score' contains infinite values.", result['messages'])
+        self.assertIn("Column 'score' has values less than 0.", result['messages'])
+        self.assertEqual(result['failing_indices'], {1, 2})
+
+    def test_nullable_dtype_bounds(self):
+        """Test nullable float columns skip the type scan and ignore NA in bounds."""
+        series = pd.Series([0.5, np.inf, -1.0, None], dtype='Float64')
+        result = FloatColumnCheck('score', min=0).validate(series)
+        self.assertIn("Column 'score' contains infinite values.", result['messages'])
+        self.assertIn("Column 'score' has values less than 0.", result['messages'])
+        self.assertEqual(result['failing_indices'], {1, 2})
+        passing = pd.Series([0.5, None, 1.0], dtype='Float64')
+        self.assertEqual(FloatColumnCheck('score', min=0, max=1).validate(passing)['messages'], [])
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_arrow_dtype_bounds(self):
+        """Test Arrow-backed columns give the same results as NumPy-backed ones."""
+        values = [0.5, np.inf, -1.0, None, 3.0]
+        check = FloatColumnCheck('score', min=0, max=2)
+        result = check.validate(pd.Series(values, dtype='float64[pyarrow]'))
+        expected = check.validate(pd.Series(values, dtype='float64'))
+        self.assertEqual(result['messages'], expected['messages'])
+        self.assertEqual(result['failing_indices'], {1, 2, 4})
+
     def test_both_min_and_max(self):
         """Test fails when values fall outside specified min and max bounds."""
         series = pd.Series([-1, 0.5, 2])
@@ -360,6 +474,14 @@ class TestFloatColumnCheck(unittest.TestCase):
         self.assertEqual(result['messages'], [])
         self.assertEqual(result['failing_indices'], set())
 
+    def test_bounds_with_nan_values(self):
+        """Test NaN neither hides out-of-range values nor fails an all-NaN column."""
+        check = FloatColumnCheck('score', min=0.0, max=1.0)
+        result = check.validate(pd.Series([np.nan, -0.5, 0.4, 1.5]))
+        self.assertEqual(len(result['messages']), 2)
+        self.assertEqual(result['failing_indices'], {1, 3})
+        self.assertEqual(check.validate(pd.Series([np.nan, np.nan]))['messages'], [])
+
     def test_not_in_set_constraint(self):
         """Test fails when disallowed values are present in the series."""
         series = pd.Series([0.1, 0.2, 0.3, 0.5, np.nan])
@@ -407,6 +529,72 @@ class TestIntColumnCheck(unittest.TestCase):
         self.assertIn(1, result['failing_indices'])
         self.assertIn(2, result['failing_indices'])
 
+    def test_object_column_of_ints_and_nulls(self):
+        """Test object columns of ints and nulls pass the type check; bools mixed in still fail."""
+        series = pd.Series([1, np.int64(7), None, 3], dtype=object)
+        result = IntColumnCheck('col', max=5).validate(series)
+        self.assertEqual(result['messages'], ["Column 'col' has values greater than 5."])
+        self.assertEqual(result['failing_indices'], {1})
+        mixed = pd.Series([1, True, None], dtype=object)
+        self.assertEqual(IntColumnCheck('col').validate(mixed)['failing_indices'], {1})
+
+    def test_mixed_object_column_classification(self):
+        """Test mixed object columns flag fractional, infinite, bool and string values only."""
+        series = pd.Series([1, 2.0, 2.5, float('inf'), np.nan, True, 'x', np.int32(4), 2 ** 70], dtype=object)
+        result = IntColumnCheck('col').validate(series)
+        self.assertEqual(result['failing_indices'], {2, 3, 5, 6})
+        self.assertIn("Column 'col' contains infinite values.", result['messages'])
+
+    def test_unsigned_bounds_outside_dtype_range(self):
+        """Test bounds outside an unsigned dtype's range compare by value, not wrapped."""
+        series = pd.Series([0, 5, 255], dtype='uint8')
+        self.assertEqual(IntColumnCheck('col', min=-1, max=300).validate(series)['messages'], [])
+        result = IntColumnCheck('col', min=1, max=254).validate(series)
+        self.assertEqual(result['failing_indices'], {0, 2})
+
+    def test_failing_mask_aligned_with_series(self):
+        """Test the result carries a boolean mask matching the failing rows."""
+        series = pd.Series([1, 'x', 5, None], index=[10, 20, 30, 40])
+        result = IntColumnCheck('col', max=3, not_null=True).validate(series)
+        np.testing.assert_array_equal(result['failing_mask'], [False, True, True, True])
+        self.assertEqual(result['failing_indices'], {20, 30, 40})
+
+    def test_float_dtype_fast_path(self):
+        """Test float columns flag fractional and infinite values but not NaN."""
+        series = pd.Series([1.0, 2.5, np.inf, np.nan, 4.0], dtype='float32')
+        result = IntColumnCheck('col').validate(series)
+        self.assertEqual(result['failing_indices'], {1, 2})
+        self.assertIn("Column 'col' contains infinite values.", result['messages'])
+
+    def test_failure_sample_reaches_past_repeated_values(self):
+        """Test the message sample lists the first distinct failing values even after long repeats."""
+        series = pd.Series([1.5] * 100 + [2.5] * 50 + [1.5, 3.5, 4.5], dtype=object)
+        result = IntColumnCheck('col').validate(series)
+        self.assertIn(
+            "Column 'col' contains values that are not integer-like (e.g., decimals or strings): [1.5, 2.5, 3.5].",
+            result['messages']
+        )
+        self.assertEqual(result['failing_indices'].count, 153)
+
+    def test_nullable_and_arrow_integer_dtypes(self):
+        """Test nullable and Arrow-backed columns are classified without a per-value scan."""
+        ints = pd.Series([1, None, 7], dtype='Int64')
+        result = IntColumnCheck('col', max=5).validate(ints)
+        self.assertEqual(result['messages'], ["Column 'col' has values greater than 5."])
+        self.assertEqual(result['failing_indices'], {2})
+        floats = pd.Series([1.0, None, 2.5, np.inf], dtype='Float64')
+        result = IntColumnCheck('col').validate(floats)
+        self.assertEqual(result['failing_indices'], {2, 3})
+        self.assertIn("Column 'col' contains infinite values.", result['messages'])
+        if pyarrow is not None:
+            arrow = pd.Series([1, None, 7], dtype='int64[pyarrow]')
+            self.assertEqual(IntColumnCheck('col', max=5).validate(arrow)['failing_indices'], {2})
+
+    def test_bool_dtype_is_not_integer(self):
+        """Test a bool-typed column fails the integer check on every row."""
+        result = IntColumnCheck('col').validate(pd.Series([True, False]))
+        self.assertEqual(result['failing_indices'], {0, 1})
+
     def test_equals_valid_integer(self):
         """Test passes when all values equal the specified integer."""
         series = pd.Series([42, 42, 42])
@@ -589,6 +777,56 @@ class TestStringColumnCheck(unittest.TestCase):
         result = check.validate(series)
         self.assertEqual(result['failing_indices'], {1, 2})
 
+    def test_in_set_index_reused_across_calls(self):
+        """Test allowed values are indexed once and give consistent results on reuse."""
+        check = StringColumnCheck('color', in_set=['red', 'blue', 'red'], not_in_set=['blue'])
+        index = check._in_set_index
+        for _ in range(2):
+            result = check.validate(pd.Series(['red', 'green', None, 'blue']))
+            self.assertEqual(result['failing_indices'], {1, 3})
+        self.assertIs(check._in_set_index, index)
+        self.assertEqual(check.in_set, ['red', 'blue', 'red'])
+
+    def test_precompiled_regex(self):
+        """Test a compiled pattern is used as given and reported by its source."""
+        pattern = re.compile(r'^[a-z]+$', re.IGNORECASE)
+        check = StringColumnCheck('code', regex=pattern)
+        self.assertIs(check._pattern, pattern)
+        result = check.validate(pd.Series(['abc', 'ABC', 'a1']))
+        self.assertEqual(result['failing_indices'], {2})
+        self.assertEqual(
+            result['messages'], ["Column 'code' has values not matching regex '^[a-z]+$': ['a1']."]
+        )
+
+    def test_in_set_on_categorical_column(self):
+        """Test categorical columns match object columns, including unused categories and nulls."""
+        values = ['red', 'green', None, 'blue', 'green']
+        series = pd.Series(values, dtype=pd.CategoricalDtype(['red', 'green', 'blue', 'pink']))
+        check = StringColumnCheck('color', in_set=['red', 'blue'], not_in_set=['blue'])
+        result = check.validate(series)
+        expected = check.validate(pd.Series(values))
+        self.assertEqual(result['failing_indices'], {1, 3, 4})
+        self.assertEqual(result['messages'], expected['messages'])
+
+    def test_regex_sample_shows_coerced_values(self):
+        """Test the regex failure sample lists the string form of failing values, skipping nulls."""
+        series = pd.Series(['abc', 123, None, 123, 4.5])
+        result = StringColumnCheck('mixed', regex=r'^[a-z]+$').validate(series)
+        self.assertEqual(
+            result['messages'],
+            ["Column 'mixed' has values not matching regex '^[a-z]+$': ['123', '4.5']."]
+        )
+        self.assertEqual(result['failing_indices'], {1, 3, 4})
+
+    def test_regex_sample_of_str_subclasses_is_plain_str(self):
+        """Test str subclasses like np.str_ are matched in place and reported as plain strings."""
+        series = pd.Series([np.str_('ok'), np.str_('BAD'), 'fine'], dtype=object)
+        result = StringColumnCheck('col', regex=r'^[a-z]+$').validate(series)
+        self.assertEqual(
+            result['messages'],
+            ["Column 'col' has values not matching regex '^[a-z]+$': ['BAD']."]
+        )
+
     def test_not_null_flag(self):
         """Test fails when nulls are present and not_null=True."""
         series = pd.Series(['a', None, 'b'])
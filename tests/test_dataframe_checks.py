@@ -1,9 +1,18 @@
 """Unit tests for dataframe_checks.py"""
+import sys
+import threading
 import unittest
+from unittest.mock import patch
+import numpy as np
 import pandas as pd
+try:
+    import numba
+except ImportError:
+    numba = None
 from framecheck.dataframe_checks import (
     ColumnComparisonCheck,
     CustomCheck,
+    DataFrameCheck,
     DefinedColumnsOnlyCheck, 
     ExactColumnsCheck,
     IsEmptyCheck,
@@ -12,6 +21,7 @@ from framecheck.dataframe_checks import (
     RowCountCheck,
     UniquenessCheck
 )
+from framecheck.utilities import map_threaded
 
 
 class TestColumnComparisonCheck(unittest.TestCase):
@@ -217,6 +227,14 @@ class TestColumnComparisonCheck(unittest.TestCase):
         expected_failing = {1, 3, 4, 5}
         self.assertEqual(result['failing_indices'], expected_failing)
 
+    def test_mixed_object_values_compared_per_row(self):
+        """Test incomparable pairs fail individually while comparable rows are still checked."""
+        df = pd.DataFrame({'a': [1, 'x', 5, None], 'b': [2, 3, 4, 1]}, index=['w', 'x', 'y', 'z'])
+        result = ColumnComparisonCheck('a', '<', 'b').validate(df)
+        self.assertEqual(result['failing_indices'], {'x', 'y', 'z'})
+        np.testing.assert_array_equal(result['failing_indices'].mask, [False, True, True, True])
+        self.assertIn("failed on 3 row(s)", result['messages'][0])
+
     def test_invalid_date_handling(self):
         """Test handling of invalid date formats."""
         # Modified dataframe with explicitly invalid date
@@ -375,6 +393,123 @@ class TestCustomCheck(unittest.TestCase):
         result = check.validate(df)
         self.assertEqual(result['failing_indices'], set())
 
+    def test_vectorized_function(self):
+        """Test vectorized function is called on the whole DataFrame."""
+        df = pd.DataFrame({'a': [1, -2, 3, -4]}, index=[10, 11, 12, 13])
+        check = CustomCheck(function=lambda d: d['a'] > 0, vectorized=True)
+        result = check.validate(df)
+        self.assertEqual(result['failing_indices'], {11, 13})
+        self.assertIn("failed on 2 row(s)", result['messages'][0])
+
+    def test_vectorized_function_wrong_length(self):
+        """Test raises ValueError when a vectorized function returns a scalar."""
+        df = pd.DataFrame({'a': [1, 2]})
+        check = CustomCheck(function=lambda d: True, vectorized=True)
+        with self.assertRaises(ValueError):
+            check.validate(df)
+
+    def test_columnar_function(self):
+        """Test a function named after columns receives whole column arrays."""
+        df = pd.DataFrame({'start': [1, 5, 2], 'end': [2, 4, 3]}, index=['x', 'y', 'z'])
+        calls = []
+
+        def ordered(start, end):
+            calls.append(type(start))
+            return start < end
+
+        result = CustomCheck(function=ordered, column_arrays=True).validate(df)
+        self.assertEqual(result['failing_indices'], {'y'})
+        self.assertEqual(calls, [np.ndarray])
+
+    def test_columnar_function_scalar_fallback(self):
+        """Test a scalar-only column function is applied element-wise."""
+        df = pd.DataFrame({'a': [1, 5, 2], 'b': [2, 4, 3]})
+        check = CustomCheck(function=lambda a, b: True if a < b else False, column_arrays=True)
+        result = check.validate(df)
+        self.assertEqual(result['failing_indices'], {1})
+
+    @unittest.skipIf(numba is None, "numba is not installed")
+    def test_columnar_scalar_function_compiled_with_numba(self):
+        """Test a scalar column predicate is compiled to a ufunc when numba is available."""
+        df = pd.DataFrame({'a': [1.0, 5.0, 2.0], 'b': [2.0, 4.0, 3.0]})
+        check = CustomCheck(function=lambda a, b: True if a < b else False, column_arrays=True)
+        result = check.validate(df)
+        self.assertEqual(result['failing_indices'], {1})
+        self.assertIsNotNone(check._ufunc)
+        self.assertEqual(check._numba_failed, set())
+
+    @unittest.skipIf(numba is None, "numba is not installed")
+    def test_numba_failure_is_remembered_per_dtype(self):
+        """Test a dtype numba cannot compile for falls back without disabling other dtypes."""
+        check = CustomCheck(function=lambda a, b: True if a.conjugate() == b else False, column_arrays=True)
+        flags = pd.DataFrame({'a': [True, False], 'b': [True, True]})
+        self.assertEqual(check.validate(flags)['failing_indices'], {1})
+        self.assertEqual(check._numba_failed, {(np.dtype(bool), np.dtype(bool))})
+        numbers = pd.DataFrame({'a': [1, 2], 'b': [1, 3]})
+        self.assertEqual(check.validate(numbers)['failing_indices'], {1})
+        self.assertEqual(check._numba_failed, {(np.dtype(bool), np.dtype(bool))})
+        self.assertEqual(len(check._ufunc.types), 1)  # compiled for the integer columns only
+
+    def test_numba_skips_unsupported_dtypes(self):
+        """Test columns of dtypes numba cannot compile for use the element-wise fallback."""
+        df = pd.DataFrame({'a': np.array([1.0, 5.0], dtype=np.float16), 'b': np.array([2.0, 4.0], dtype=np.float16)})
+        check = CustomCheck(function=lambda a, b: True if a < b else False, column_arrays=True)
+        self.assertEqual(check.validate(df)['failing_indices'], {1})
+        self.assertIsNone(check._ufunc)
+
+    def test_row_function_when_params_are_not_columns(self):
+        """Test functions whose parameters are not columns still receive rows."""
+        df = pd.DataFrame({'a': [1, -1]})
+        check = CustomCheck(function=lambda row, threshold=0: row['a'] > threshold)
+        result = check.validate(df)
+        self.assertEqual(result['failing_indices'], {1})
+
+    def test_row_function_parameter_named_like_column(self):
+        """Test a row function still receives rows when its parameter shares a column's name."""
+        df = pd.DataFrame({'x': [1, 2], 'a': [1, -1]})
+        result = CustomCheck(function=lambda x: x['a'] > 0).validate(df)
+        self.assertEqual(result['failing_indices'], {1})
+
+    def test_column_arrays_missing_column(self):
+        """Test a column_arrays function reports parameters that are not columns."""
+        df = pd.DataFrame({'start': [1, 2]})
+        result = CustomCheck(function=lambda start, end: start < end, column_arrays=True).validate(df)
+        self.assertEqual(result['messages'], ["Columns ['end'] do not exist for custom check."])
+
+    def test_column_arrays_invalid_arguments(self):
+        """Test column_arrays rejects other modes and functions without named parameters."""
+        with self.assertRaises(ValueError):
+            CustomCheck(function=lambda d: d['a'] > 0, vectorized=True, column_arrays=True)
+        with self.assertRaises(ValueError):
+            CustomCheck(function=r'^a$', column='a', column_arrays=True)
+        with self.assertRaises(ValueError):
+            CustomCheck(function=lambda *cols: True, column_arrays=True)
+
+    def test_regex_pattern(self):
+        """Test a regular expression is matched against the given column."""
+        df = pd.DataFrame({'zip': ['12345', '1234', None, 12345]})
+        check = CustomCheck(function=r'^\d{5}$', column='zip')
+        result = check.validate(df)
+        self.assertEqual(result['failing_indices'], {1, 2, 3})
+
+    def test_regex_pattern_requires_column(self):
+        """Test raises ValueError when a regex is given without a column."""
+        with self.assertRaises(ValueError):
+            CustomCheck(function=r'^\d{5}$')
+
+    def test_regex_pattern_missing_column(self):
+        """Test reports a message when the regex column does not exist."""
+        check = CustomCheck(function=r'^\d{5}$', column='zip')
+        result = check.validate(pd.DataFrame({'a': [1]}))
+        self.assertIn("does not exist for custom check", result['messages'][0])
+
+    def test_empty_dataframe(self):
+        """Test passes on an empty DataFrame without calling the function."""
+        check = CustomCheck(function=lambda row: row['a'] > 0)
+        result = check.validate(pd.DataFrame({'a': []}))
+        self.assertEqual(result['messages'], [])
+        self.assertEqual(result['failing_indices'], set())
+
 
 class TestDefinedColumnsOnlyCheck(unittest.TestCase):
     """
@@ -397,7 +532,51 @@ class TestDefinedColumnsOnlyCheck(unittest.TestCase):
         self.assertTrue(result['messages'])
         self.assertIn("Unexpected columns", result['messages'][0])
         self.assertEqual(result['failing_indices'], set())
+
+    def test_extra_columns_reported_sorted_once(self):
+        """Test unexpected columns are listed sorted and without repeats."""
+        df = pd.DataFrame([[1, 2, 3, 4]], columns=['z', 'a', 'y', 'z'])
+        check = DefinedColumnsOnlyCheck(expected_columns=['a'])
+        self.assertEqual(
+            check.validate(df)['messages'],
+            ["Unexpected columns in DataFrame: ['y', 'z']"]
+        )
         
+    def test_revalidation_after_columns_change(self):
+        """Test cached column sets are not reused once the columns change."""
+        df = pd.DataFrame({'a': [1], 'b': [2]})
+        check = DefinedColumnsOnlyCheck(expected_columns=['a', 'b'])
+        self.assertEqual(check.validate(df)['messages'], [])
+        self.assertEqual(check.validate(df)['messages'], [])
+        df.columns = ['a', 'c']
+        self.assertIn("Unexpected columns", check.validate(df)['messages'][0])
+
+    def test_memoized_messages_are_copies(self):
+        """Test repeated layouts return fresh message lists from a bounded memo."""
+        df = pd.DataFrame({'a': [1], 'x': [2]})
+        check = DefinedColumnsOnlyCheck(expected_columns=['a'])
+        first = check.validate(df)['messages']
+        first.append('mutated')
+        self.assertEqual(check.validate(df)['messages'], ["Unexpected columns in DataFrame: ['x']"])
+        for i in range(20):
+            check.validate(pd.DataFrame({f'c{i}': [1]}))
+        self.assertLessEqual(len(check._column_memo), 8)
+
+    def test_concurrent_calls_share_bounded_memo(self):
+        """Test threads missing on a full memo evict safely and get their own messages."""
+        check = DefinedColumnsOnlyCheck(expected_columns=['a'])
+        frames = [pd.DataFrame({'a': [1], f'x{i}': [2]}) for i in range(64)]
+        expected = [[f"Unexpected columns in DataFrame: ['x{i}']"] for i in range(64)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # switch threads often to expose races
+        try:
+            for _ in range(20):
+                results = map_threaded(check.validate, frames, max_workers=8)
+                self.assertEqual([r['messages'] for r in results], expected)
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertLessEqual(len(check._column_memo), 8)
+
     def test_serialize_defined_columns_check(self):
         """Test the serialization of DefinedColumnsOnlyCheck."""
         check = DefinedColumnsOnlyCheck(expected_columns=['a', 'b'])
@@ -497,6 +676,52 @@ class TestNoNullsCheck(unittest.TestCase):
         self.assertEqual(result['messages'], [])
         self.assertEqual(result['failing_indices'], set())
 
+    def test_results_are_independent_across_calls(self):
+        """Test later calls on the same check do not alter earlier results."""
+        check = NoNullsCheck()
+        clean = check.validate(pd.DataFrame({'a': [1.0, 2.0]}))
+        dirty = check.validate(pd.DataFrame({'a': [None, 2.0]}))
+        again = check.validate(pd.DataFrame({'a': [1.0, None]}))
+        self.assertEqual(clean['failing_indices'], set())
+        self.assertEqual(dirty['failing_indices'], {0})
+        self.assertEqual(again['failing_indices'], {1})
+
+    def test_concurrent_calls_on_one_check(self):
+        """Test threads validating with the same check get their own failing rows."""
+        check = NoNullsCheck()
+        frames, expected = [], []
+        for i in range(16):
+            # Clean frames interleaved with frames holding one null at row i
+            values = np.ones(1000)
+            if i % 2:
+                values[i] = np.nan
+            frames.append(pd.DataFrame({'a': values, 'b': values}))
+            expected.append({i} if i % 2 else set())
+        state = dict(vars(check))
+        for _ in range(50):
+            results = map_threaded(check.validate, frames, max_workers=8)
+            self.assertEqual([set(r['failing_indices']) for r in results], expected)
+        # No per-call buffers are kept on the shared instance
+        self.assertEqual(vars(check), state)
+
+    def test_mixed_dtypes(self):
+        """Test nulls are found across numpy, extension and datetime columns."""
+        df = pd.DataFrame({
+            'i': [1, 2, 3],
+            'f': [1.0, float('nan'), 3.0],
+            'n': pd.array([1, None, 3], dtype='Int64'),
+            't': pd.to_datetime(['2024-01-01', '2024-01-02', None]),
+            's': pd.array(['a', 'b', None], dtype='string'),
+        })
+        result = NoNullsCheck().validate(df)
+        self.assertEqual(result['messages'], [
+            "Column 'f' contains null values.",
+            "Column 'n' contains null values.",
+            "Column 't' contains null values.",
+            "Column 's' contains null values.",
+        ])
+        self.assertEqual(result['failing_indices'], {1, 2})
+
 
 
 class TestIsEmptyCheck(unittest.TestCase):
@@ -545,6 +770,12 @@ class TestNotEmptyCheck(unittest.TestCase):
         self.assertIn('DataFrame is unexpectedly empty.', result['messages'][0])
         self.assertEqual(result['failing_indices'], set())
 
+    def test_fails_if_rows_but_no_columns(self):
+        """Test a DataFrame with an index but no columns still counts as empty."""
+        df = pd.DataFrame(index=[0, 1])
+        result = NotEmptyCheck().validate(df)
+        self.assertEqual(result['messages'], ['DataFrame is unexpectedly empty.'])
+
 
 
 class TestRowCountCheck(unittest.TestCase):
@@ -604,6 +835,67 @@ class TestRowCountCheck(unittest.TestCase):
             RowCountCheck(exact=3, min=1)
 
 
+class TestShouldRun(unittest.TestCase):
+    """
+    Test suite for DataFrameCheck.should_run, verifying that only cheap checks
+    keep running once validation has failed.
+    """
+    def test_all_checks_run_without_errors(self):
+        """Test every check runs while no error has been recorded."""
+        for check in [RowCountCheck(exact=1), UniquenessCheck(), NoNullsCheck()]:
+            self.assertTrue(check.should_run(False))
+
+    def test_only_cheap_checks_run_after_errors(self):
+        """Test row-scanning checks are skipped once an error exists."""
+        self.assertTrue(RowCountCheck(exact=1).should_run(True))
+        self.assertTrue(ExactColumnsCheck(['a']).should_run(True))
+        self.assertFalse(UniquenessCheck().should_run(True))
+        self.assertFalse(CustomCheck(function=lambda row: True).should_run(True))
+
+    def test_cheap_checks_have_lower_priority(self):
+        """Test structural checks are ordered before row-scanning checks."""
+        self.assertLess(ExactColumnsCheck(['a']).priority, NoNullsCheck().priority)
+        self.assertLess(NoNullsCheck().priority, UniquenessCheck().priority)
+
+
+class TestRunAll(unittest.TestCase):
+    """
+    Test suite for DataFrameCheck.run_all, verifying sequential and threaded
+    execution return the same results in input order.
+    """
+    def test_results_in_input_order_small_frame(self):
+        """Test small frames are validated sequentially, in order."""
+        df = pd.DataFrame({'a': [1, None]})
+        checks = [RowCountCheck(exact=2), NoNullsCheck(), RowCountCheck(exact=3)]
+        results = DataFrameCheck.run_all(checks, df)
+        self.assertEqual(results[0]['messages'], [])
+        self.assertEqual(results[1]['failing_indices'], {1})
+        self.assertIn("exactly 3", results[2]['messages'][0])
+
+    def test_results_in_input_order_large_frame(self):
+        """Test large frames produce the same results through the thread pool."""
+        n = 20_000
+        df = pd.DataFrame({'a': range(n), 'b': [None] + [1.0] * (n - 1)})
+        checks = [NoNullsCheck(), UniquenessCheck(columns=['a']), RowCountCheck(max=10)]
+        results = DataFrameCheck.run_all(checks, df, max_workers=3)
+        self.assertEqual(results[0]['failing_indices'], {0})
+        self.assertEqual(results[1]['messages'], [])
+        self.assertIn("at most 10", results[2]['messages'][0])
+
+    def test_custom_checks_run_in_calling_thread(self):
+        """Test user functions stay on the calling thread unless marked thread-safe."""
+        n = 20_000
+        df = pd.DataFrame({'a': range(n)})
+        seen = []
+        record = lambda frame: seen.append(threading.get_ident()) or np.ones(len(frame), dtype=bool)
+        custom = CustomCheck(record, vectorized=True)
+        checks = [NoNullsCheck(), custom, UniquenessCheck(columns=['a'])]
+        self.assertFalse(custom.thread_safe)
+        DataFrameCheck.run_all(checks, df, max_workers=3)
+        self.assertEqual(seen, [threading.get_ident()])
+        self.assertTrue(CustomCheck(r'^\d+$', column='a').thread_safe)
+
+
 class TestUniquenessCheck(unittest.TestCase):
     """
     Test suite for UniquenessCheck, validating that rows or subsets of columns
@@ -643,6 +935,28 @@ class TestUniquenessCheck(unittest.TestCase):
         self.assertIn('not unique based on columns', result['messages'][0])
         self.assertIn(1, result['failing_indices'])
 
+    def test_all_duplicate_occurrences_fail(self):
+        """Test every occurrence of a duplicated key is reported."""
+        df = pd.DataFrame({'id': [1, 2, 1, 3, 2]})
+        check = UniquenessCheck(columns=['id'])
+        result = check.validate(df)
+        self.assertEqual(result['failing_indices'], {0, 1, 2, 4})
+
+    def test_single_column_matches_duplicated(self):
+        """Test the single-key path agrees with DataFrame.duplicated, nulls included."""
+        df = pd.DataFrame({'k': ['a', None, 'b', None, 'a', 'c']})
+        result = UniquenessCheck(columns=['k']).validate(df)
+        expected = set(df.index[df.duplicated(subset=['k'], keep=False)])
+        self.assertEqual(result['failing_indices'], expected)
+        self.assertEqual(result['failing_indices'], {0, 1, 3, 4})
+
+    def test_integer_key_collisions_are_confirmed(self):
+        """Test rows that collide on the mixed integer key are not reported unless equal."""
+        df = pd.DataFrame({'a': [1, 2, 1, 3], 'b': [7, 7, 7, 8]})
+        with patch('framecheck.dataframe_checks._KEY_MIX', np.uint64(0)):
+            result = UniquenessCheck(columns=['a', 'b']).validate(df)
+        self.assertEqual(result['failing_indices'], {0, 2})
+
     def test_missing_columns_handled(self):
         """Test fails gracefully when specified uniqueness columns are missing."""
         df = pd.DataFrame({'x': [1, 2]})
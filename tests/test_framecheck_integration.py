@@ -1,22 +1,55 @@
 """Integration tests for main FrameCheck class"""
+import re
 import unittest
+from functools import lru_cache
 from unittest.mock import patch
 import pandas as pd
 import numpy as np
 from decimal import Decimal
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 from framecheck.frame_check import FrameCheck
 from framecheck.function_registry import register_check_function
+from framecheck.utilities import map_threaded
+
+
+_EMAIL_RE = re.compile(r'.+@.+\..+')
+_NOT_UNIQUE_RE = re.compile(r'not unique', re.IGNORECASE)
 
 
 @register_check_function()
 def _always_fail(row):
     return False
 
+
+@lru_cache(maxsize=None)
+def _schema(*specs):
+    """
+    Build a FrameCheck with one column check per spec, once per distinct spec.
+
+    Each spec is ``(column_name, type, options)`` where `options` is a tuple
+    of ``(keyword, value)`` pairs passed to `FrameCheck.column`. Tests must
+    only validate with the returned FrameCheck, never add checks to it.
+    """
+    frame_check = FrameCheck()
+    for column_name, column_type, options in specs:
+        frame_check = frame_check.column(column_name, type=column_type, **dict(options))
+    return frame_check
+
+
 class TestFrameCheckDataFrameChecks(unittest.TestCase):
     """
     Test suite for FrameCheck integration with DataFrame-level checks,
     including column validations, null constraints, row counts, and uniqueness.
     """
+    @classmethod
+    def setUpClass(cls):
+        """Build the read-only DataFrames shared across tests."""
+        cls._df_duplicates = pd.DataFrame({'a': [1, 2, 2]})
+
     def test_columns_applies_check_to_multiple_fields(self):
         """Test fails when multiple columns exceed max constraint."""
         df = pd.DataFrame({
@@ -119,10 +152,145 @@ class TestFrameCheckDataFrameChecks(unittest.TestCase):
 
     def test_unique_check_via_framecheck(self):
         """Test fails when column is not unique and uniqueness is required."""
-        df = pd.DataFrame({'a': [1, 2, 2]})
         schema = FrameCheck().column('a', type='int').unique(columns=['a'])
-        result = schema.validate(df)
-        self.assertIn('not unique', result.summary().lower())
+        result = schema.validate(self._df_duplicates)
+        self.assertRegex(result.summary(), _NOT_UNIQUE_RE)
+
+
+class TestShortCircuitValidation(unittest.TestCase):
+    """Tests skipping row-scanning DataFrame checks once validation has failed."""
+
+    def setUp(self):
+        self.df = pd.DataFrame({'a': [1, 1, 2]})
+        self.schema = (
+            FrameCheck()
+            .custom_check(lambda row: False, description="never valid")
+            .unique(columns=['a'])
+            .row_count(5)
+        )
+
+    def test_all_checks_run_by_default(self):
+        """Without short-circuiting every check reports, in declaration order."""
+        result = self.schema.validate(self.df)
+        self.assertEqual(len(result.errors), 3)
+        self.assertIn('never valid', result.errors[0])
+        self.assertIn('exactly 5', result.errors[2])
+
+    def test_expensive_checks_skipped_after_error(self):
+        """Cheap checks run first; row-scanning checks are skipped after an error."""
+        result = self.schema.validate(self.df, short_circuit=True)
+        self.assertFalse(result.is_valid)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn('exactly 5', result.errors[0])
+
+    def test_expensive_checks_run_when_cheap_checks_pass(self):
+        """Row-scanning checks still run when nothing has failed yet."""
+        result = self.schema.validate(pd.concat([self.df, self.df.iloc[:2]]), short_circuit=True)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn('never valid', result.errors[0])
+
+
+class TestFailFastValidation(unittest.TestCase):
+    """Tests stopping at the first error and capping recorded failing rows."""
+
+    def setUp(self):
+        self.df = pd.DataFrame({'a': [5, 6, 7, 8], 'b': ['x', 'y', 'z', 'w']})
+        self.schema = (
+            FrameCheck()
+            .column('a', type='int', max=5)
+            .column('b', type='string', in_set=['x'])
+            .row_count(10)
+        )
+
+    def test_stops_after_first_failing_check(self):
+        """Only the first failing check reports when fail_fast is set."""
+        result = self.schema.validate(self.df, fail_fast=True)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn("'a'", result.errors[0])
+        self.assertEqual(result._failing_row_indices, {1, 2, 3})
+
+    def test_warnings_do_not_stop_validation(self):
+        """Warn-only failures are not errors, so later checks still run."""
+        schema = FrameCheck().column('a', type='int', max=5, warn_only=True).row_count(10)
+        with self.assertWarns(UserWarning):
+            result = schema.validate(self.df, fail_fast=True)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn('exactly 10', result.errors[0])
+
+    def test_sample_limit_truncates_failing_rows(self):
+        """Each check records at most sample_limit failing rows; messages are unchanged."""
+        full = self.schema.validate(self.df)
+        result = self.schema.validate(self.df, sample_limit=1)
+        self.assertEqual(result.errors, full.errors)
+        self.assertEqual(result._failing_row_indices, {1})
+        self.assertEqual(len(result.get_invalid_rows(self.df)), 1)
+
+    def test_sample_limit_zero_records_no_rows(self):
+        """A sample_limit of 0 keeps the verdict but records no failing rows."""
+        result = self.schema.validate(self.df, sample_limit=0)
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result._failing_row_indices, set())
+
+
+class TestParallelColumnChecks(unittest.TestCase):
+    """Tests column checks run on a thread pool give the same result as sequential runs."""
+
+    def test_threaded_matches_sequential(self):
+        """Messages keep declaration order and failing rows match the sequential path."""
+        n = 20_000
+        df = pd.DataFrame({
+            'a': np.arange(n),
+            'b': np.where(np.arange(n) % 1000 == 0, -1.0, 1.0),
+            'c': ['x'] * (n - 1) + ['y'],
+            'd': [True] * n,
+        })
+        schema = (
+            FrameCheck()
+            .column('a', type='int', max=n - 2)
+            .column('missing')
+            .column('b', type='float', min=0)
+            .column('c', type='string', in_set=['x'])
+            .column('d', type='bool')
+        )
+        threaded = schema.validate(df)
+        with patch('framecheck.frame_check.PARALLEL_MIN_ROWS', n + 1):
+            sequential = schema.validate(df)
+
+        self.assertEqual(threaded.errors, sequential.errors)
+        self.assertIn("Column 'missing' is missing.", threaded.errors[1])
+        self.assertEqual(set(threaded._failing_row_indices), set(sequential._failing_row_indices))
+        self.assertEqual(len(threaded._failing_row_indices), 21)
+
+    def test_max_workers_caps_threads(self):
+        """max_workers is passed to the thread pool, and 1 keeps every check in the calling thread."""
+        n = 20_000
+        df = pd.DataFrame({
+            'a': np.arange(n),
+            'b': np.arange(n) / n,
+            'c': ['x'] * n,
+            'd': [True] * n,
+        })
+        schema = (
+            FrameCheck()
+            .column('a', type='int', max=n - 2)
+            .column('b', type='float', max=1)
+            .column('c', type='string')
+            .column('d', type='bool')
+            .unique(columns=['a'])
+            .not_empty()
+        )
+        baseline = schema.validate(df)
+        with patch('framecheck.frame_check.map_threaded', wraps=map_threaded) as column_pool, \
+                patch('framecheck.dataframe_checks.map_threaded', wraps=map_threaded) as frame_pool:
+            sequential = schema.validate(df, max_workers=1)
+            column_pool.assert_not_called()
+            frame_pool.assert_not_called()
+            threaded = schema.validate(df, max_workers=2)
+        self.assertEqual(column_pool.call_args.args[2], 2)
+        self.assertEqual(frame_pool.call_args.args[2], 2)
+        for result in (sequential, threaded):
+            self.assertEqual(result.errors, baseline.errors)
+            self.assertEqual(result._failing_row_indices, {n - 1})
 
 
 class TestFrameCheckWithCustomCheck(unittest.TestCase):
@@ -150,45 +318,50 @@ class TestFrameCheckWithCustomCheck(unittest.TestCase):
         self.assertIn("flagged_for_review must be True", result.summary())
         self.assertEqual(result._failing_row_indices, {1})
 
+    def test_row_lambda_parameter_named_like_column(self):
+        """Row lambdas receive rows even when their parameter matches a column name."""
+        df = pd.DataFrame({'x': [1, 2], 'a': [1, -1]})
+        result = FrameCheck(log_errors=False).custom_check(lambda x: x['a'] > 0, "a must be positive").validate(df)
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result._failing_row_indices, {1})
+
 
 class TestMultipleChecksSameColumn(unittest.TestCase):
     """Tests handling of multiple sequential checks applied to the same column."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the read-only DataFrames shared across tests."""
+        cls._df_low_scores = pd.DataFrame({'score': [0.1, 0.3, 0.6]})
+        cls._df_valid_scores = pd.DataFrame({'score': [0.5, 0.7]})
+        cls._df_negative_score = pd.DataFrame({'score': [-1, 0.3, 0.9]})
+
     def test_sequential_independent_checks(self):
         """Each check on same column is independently enforced."""
-        df = pd.DataFrame({'score': [0.1, 0.3, 0.6]})
-        schema = (
-            FrameCheck()
-            .column('score', type='float', min=0.2)
-            .column('score', type='float', max=0.55, warn_only=True)
-            
+        schema = _schema(
+            ('score', 'float', (('min', 0.2),)),
+            ('score', 'float', (('max', 0.55), ('warn_only', True))),
         )
-        result = schema.validate(df)
+        result = schema.validate(self._df_low_scores)
         self.assertEqual(len(result.errors), 1)
         self.assertEqual(len(result.warnings), 1)
 
     def test_redundant_checks(self):
         """Redundant checks do not conflict or interfere."""
-        df = pd.DataFrame({'score': [0.5, 0.7]})
-        schema = (
-            FrameCheck()
-            .column('score', type='float', min=0.0)
-            .column('score', type='float', min=0.0)
-            
+        schema = _schema(
+            ('score', 'float', (('min', 0.0),)),
+            ('score', 'float', (('min', 0.0),)),
         )
-        result = schema.validate(df)
+        result = schema.validate(self._df_valid_scores)
         self.assertTrue(result.is_valid)
 
     def test_error_then_warn(self):
         """Error and warning-level checks are enforced in order."""
-        df = pd.DataFrame({'score': [-1, 0.3, 0.9]})
-        schema = (
-            FrameCheck()
-            .column('score', type='float', min=0.0)
-            .column('score', type='float', max=0.8, warn_only=True)
-            
+        schema = _schema(
+            ('score', 'float', (('min', 0.0),)),
+            ('score', 'float', (('max', 0.8), ('warn_only', True))),
         )
-        result = schema.validate(df)
+        result = schema.validate(self._df_negative_score)
         self.assertEqual(len(result.errors), 1)
         self.assertEqual(len(result.warnings), 1)
 
@@ -196,6 +369,11 @@ class TestMultipleChecksSameColumn(unittest.TestCase):
 class TestComplexValidationChains(unittest.TestCase):
     """Validates that complex column-level patterns are supported and handled correctly."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the read-only DataFrames shared across tests."""
+        cls._df_email = pd.DataFrame({'email': ['a@example.com', 'bademail', 'x@x.com']})
+
     def test_equals_with_not_null(self):
         df = pd.DataFrame({'flag': [True, True, None]})
         schema = FrameCheck().column('flag', type='bool', equals=True, not_null=True)
@@ -206,16 +384,28 @@ class TestComplexValidationChains(unittest.TestCase):
 
     def test_in_set_then_regex(self):
         """in_set check followed by regex is applied correctly."""
-        df = pd.DataFrame({'email': ['a@example.com', 'bademail', 'x@x.com']})
+        schema = _schema(
+            ('email', 'string', (('in_set', ('a@example.com', 'x@x.com')),)),
+            ('email', 'string', (('regex', _EMAIL_RE),)),
+        )
+        result = schema.validate(self._df_email)
+        self.assertEqual(len(result.errors), 2)
+        
+    def test_float_then_function(self):
+        """A float check followed by a vectorized predicate runs without a row-wise apply."""
+        df = pd.DataFrame({'score': [0.2, 0.6, 1.4]})
         schema = (
             FrameCheck()
-            .column('email', type='string', in_set=['a@example.com', 'x@x.com'])
-            .column('email', type='string', regex=r'.+@.+\\..+')
-            
+            .column('score', type='float', max=1.0)
+            .custom_check(lambda d: d['score'] != 0.6, 'score must not be 0.6', vectorized=True)
         )
-        result = schema.validate(df)
+        with patch.object(pd.DataFrame, 'apply') as apply:
+            result = schema.validate(df)
+        apply.assert_not_called()
         self.assertEqual(len(result.errors), 2)
-        
+        self.assertIn('score must not be 0.6 (failed on 1 row(s))', result.errors)
+        self.assertEqual(set(result._failing_row_indices), {1, 2})
+
     def test_string_not_in_set_disallowed_values(self):
         df = pd.DataFrame({'color': ['red', 'green', 'blue']})
         schema = FrameCheck().column('color', type='string', not_in_set=['green'])
@@ -226,7 +416,16 @@ class TestComplexValidationChains(unittest.TestCase):
 
 class TestGeneralFrameCheckBehavior(unittest.TestCase):
     """Covers general validation behavior and configuration handling."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the read-only DataFrames shared across tests."""
+        cls._df_multi_column = pd.DataFrame({
+            'a': [1, 2],
+            'b': [0.1, 0.9],
+            'c': ['x', 'y']
+        })
+
     def test_column_after_finalize_raises(self):
         """Calling column after only_defined_columns raises error."""
         fc = FrameCheck().only_defined_columns()
@@ -294,17 +493,31 @@ class TestGeneralFrameCheckBehavior(unittest.TestCase):
 
     def test_valid_multi_column_schema(self):
         """Multiple valid checks across columns yield no errors."""
+        schema = (
+            FrameCheck()
+            .column('a', type='int')
+            .column('b', type='float')
+            .column('c', type='string')
+            
+        )
+        result = schema.validate(self._df_multi_column)
+        self.assertTrue(result.is_valid)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_valid_multi_column_schema_arrow_dtypes(self):
+        """Arrow-backed columns pass the same checks and report failures like NumPy ones."""
         df = pd.DataFrame({
-            'a': [1, 2],
-            'b': [0.1, 0.9],
-            'c': ['x', 'y']
+            'a': pd.array([1, 2], dtype='int64[pyarrow]'),
+            'b': pd.array([0.1, 0.9], dtype='float64[pyarrow]'),
+            'c': pd.array(['x', 'y'], dtype='string[pyarrow]')
         })
         schema = (
             FrameCheck()
             .column('a', type='int')
             .column('b', type='float')
             .column('c', type='string')
-            
         )
-        result = schema.validate(df)
-        self.assertTrue(result.is_valid)
\ No newline at end of file
+        self.assertTrue(schema.validate(df).is_valid)
+        result = FrameCheck(log_errors=False).column('c', type='string', regex='^x$').validate(df)
+        self.assertEqual(result.errors, ["Column 'c' has values not matching regex '^x$': ['y']."])
+        self.assertEqual(result._failing_row_indices, {1})
@@ -1,6 +1,7 @@
 """Unit tests for persistence.py"""
 import json
 import os
+import re
 import pytest
 import pandas as pd
 from datetime import datetime
@@ -9,6 +10,7 @@ import warnings
 
 from framecheck import FrameCheck
 from framecheck.persistence import FrameCheckPersistence
+from framecheck.function_registry import register_check_function
 from framecheck.column_checks import (
     BoolColumnCheck, DatetimeColumnCheck, FloatColumnCheck, 
     IntColumnCheck, StringColumnCheck
@@ -117,6 +119,17 @@ class TestColumnCheckSerialization:
         assert not check.validate(df_invalid).is_valid
         assert not loaded_check.validate(df_invalid).is_valid
     
+    def test_string_column_check_compiled_regex(self):
+        """Test a precompiled regex keeps its flags through a roundtrip."""
+        check = FrameCheck().column('name', type='string', regex=re.compile(r'^[a-z]+$', re.IGNORECASE))
+        data = json.loads(check.to_json())
+        assert data["column_checks"][0]["regex"] == r'^[a-z]+$'
+
+        loaded_check = FrameCheck.from_json(check.to_json())
+        df = pd.DataFrame({'name': ['Alice', 'bob', 'x1']})
+        assert check.validate(df)._failing_row_indices == {2}
+        assert loaded_check.validate(df)._failing_row_indices == {2}
+
     def test_int_column_check(self):
         """Test IntColumnCheck serialization."""
         check = FrameCheck().column(
@@ -394,6 +407,50 @@ class TestDataFrameCheckSerialization:
         with pytest.warns(UserWarning, match="Custom check.*could not be fully restored"):
             FrameCheck.from_json(json_str)
 
+    def test_vectorized_custom_check_round_trip(self):
+        """Test the vectorized flag survives serialization of registered checks."""
+        @register_check_function(name="_vectorized_positive_id")
+        def positive_id(df):
+            return df['id'] > 0
+
+        check = FrameCheck().custom_check(positive_id, "ID must be positive", vectorized=True)
+        serialized = check.to_dict()
+        assert serialized["dataframe_checks"][0]["vectorized"] is True
+
+        loaded = FrameCheck.from_dict(serialized)
+        assert loaded._dataframe_checks[0].vectorized is True
+        assert not loaded.validate(pd.DataFrame({'id': [1, -1]})).is_valid
+
+    def test_column_arrays_custom_check_round_trip(self):
+        """Test the column_arrays flag survives serialization of registered checks."""
+        @register_check_function(name="_column_arrays_ordered")
+        def ordered(start, end):
+            return start <= end
+
+        check = FrameCheck().custom_check(ordered, "Start after end", column_arrays=True)
+        serialized = check.to_dict()
+        assert serialized["dataframe_checks"][0]["column_arrays"] is True
+
+        loaded = FrameCheck.from_dict(serialized)
+        assert loaded._dataframe_checks[0].column_arrays is True
+        assert not loaded.validate(pd.DataFrame({'start': [1, 5], 'end': [2, 4]})).is_valid
+
+    def test_regex_custom_check_round_trip(self):
+        """Test regular expression custom checks are restored without a warning."""
+        check = FrameCheck().custom_check(r'^[a-z]+$', "Lowercase only", column='code')
+        json_str = check.to_json()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", UserWarning)
+            loaded = FrameCheck.from_json(json_str)
+
+        restored = loaded._dataframe_checks[0]
+        assert restored.column == 'code'
+        assert restored.pattern.pattern == r'^[a-z]+$'
+        result = loaded.validate(pd.DataFrame({'code': ['abc', 'ABC']}))
+        assert not result.is_valid
+        assert result._failing_row_indices == {1}
+
 
 class TestEdgeCases:
     """Tests for various edge cases and potential failures."""
@@ -1,8 +1,10 @@
 """Unit tests for frame_check.Schema"""
 import unittest
+from unittest.mock import patch
+import numpy as np
 import pandas as pd
 from framecheck.frame_check import Schema, ValidationResult
-from framecheck.column_checks import ColumnCheck
+from framecheck.column_checks import ColumnCheck, IntColumnCheck
 from framecheck.dataframe_checks import DefinedColumnsOnlyCheck
 
 
@@ -29,6 +31,8 @@ class DummyCheck(ColumnCheck):
         super().__init__(column_name, raise_on_fail)
         self._messages = messages or []
         self._indices = indices or set()
+        # Built once; Schema only reads check results
+        self._result = {"messages": self._messages, "failing_indices": self._indices}
 
     def validate(self, series: pd.Series) -> dict:
         """
@@ -44,7 +48,7 @@ class DummyCheck(ColumnCheck):
         dict
             Dictionary with 'messages' and 'failing_indices' keys.
         """
-        return {"messages": self._messages, "failing_indices": self._indices}
+        return self._result
 
 
 
@@ -53,9 +57,10 @@ class TestSchema(unittest.TestCase):
     Tests Schema integration with both column and dataframe-level checks,
     validating error/warning aggregation, missing columns, and schema behavior.
     """
-    def setUp(self):
-        """Initialize a sample DataFrame with expected and extra columns."""
-        self.df = pd.DataFrame({
+    @classmethod
+    def setUpClass(cls):
+        """Build the read-only DataFrame with expected and extra columns."""
+        cls.df = pd.DataFrame({
             'a': [1, 2, 3],
             'b': ['x', 'y', 'z'],
             'extra': [10, 20, 30]
@@ -67,10 +72,16 @@ class TestSchema(unittest.TestCase):
             column_checks=[DummyCheck('a'), DummyCheck('b')],
             dataframe_checks=[]
         )
-        result = schema.validate(self.df)
+        init = ValidationResult.__init__
+        with patch.object(ValidationResult, '__init__', autospec=True, side_effect=init) as mock_init, \
+                patch('framecheck.frame_check._result_mask') as mock_mask:
+            result = schema.validate(self.df)
         self.assertTrue(result.is_valid)
         self.assertEqual(result.errors, [])
         self.assertEqual(result.warnings, [])
+        # Passing checks are skipped without aggregating rows; one result is built at the end
+        mock_mask.assert_not_called()
+        mock_init.assert_called_once()
 
     def test_validation_with_errors(self):
         """Test fails when a column check returns an error message."""
@@ -94,6 +105,19 @@ class TestSchema(unittest.TestCase):
         self.assertEqual(result.errors, [])
         self.assertIn('warn a', result.warnings)
 
+    def test_schema_failure_case_cap(self):
+        """Test the schema's sample_limit caps recorded rows unless validate overrides it."""
+        df = pd.DataFrame({'a': range(10**5)})
+        schema = Schema(
+            column_checks=[DummyCheck('a', messages=['fail a'], indices=set(range(10**5)))],
+            dataframe_checks=[],
+            sample_limit=1000
+        )
+        result = schema.validate(df)
+        self.assertEqual(len(result._failing_row_indices), 1000)
+        self.assertEqual(result.errors, ['fail a'])
+        self.assertEqual(len(schema.validate(df, sample_limit=10)._failing_row_indices), 10)
+
     def test_missing_column_error(self):
         """Test fails when a column in the check is missing from the DataFrame."""
         schema = Schema(
@@ -136,6 +160,38 @@ class TestSchema(unittest.TestCase):
         with self.assertRaises(TypeError):
             schema.validate(self.df)
 
+    def test_checks_on_same_column_share_series(self):
+        """Test checks targeting one column receive the same extracted Series."""
+        seen = []
+
+        class RecordingCheck(DummyCheck):
+            def validate(self, series):
+                seen.append(series)
+                return super().validate(series)
+
+        schema = Schema(column_checks=[RecordingCheck('a'), RecordingCheck('b'), RecordingCheck('a')], dataframe_checks=[])
+        getitem = pd.DataFrame.__getitem__
+        with patch.object(pd.DataFrame, '__getitem__', autospec=True, side_effect=getitem) as mock_getitem:
+            schema.validate(self.df)
+        self.assertIs(seen[0], seen[2])
+        self.assertEqual(seen[1].name, 'b')
+        self.assertEqual([c.args[1] for c in mock_getitem.call_args_list], ['a', 'b'])
+
+    def test_failing_masks_are_combined(self):
+        """Test row masks from checks and plain label sets are OR-ed per severity."""
+        schema = Schema(
+            column_checks=[
+                IntColumnCheck('a', max=2),
+                DummyCheck('b', messages=['warn b'], indices={0}, raise_on_fail=False),
+            ],
+            dataframe_checks=[]
+        )
+        result = schema.validate(self.df)
+        np.testing.assert_array_equal(result._failing_mask, [True, False, True])
+        np.testing.assert_array_equal(result._error_mask, [False, False, True])
+        self.assertEqual(result._failing_row_indices, {0, 2})
+        self.assertEqual(result._error_indices, {2})
+
     def test_dataframe_check_warn_only(self):
         """Test passes with warnings when a dataframe-level check fails with raise_on_fail=False."""
         class DummyDFCheck:
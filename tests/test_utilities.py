@@ -1,9 +1,15 @@
 """Unit tests for utilities.py"""
 import unittest
-from framecheck.utilities import CheckFactory
+import numpy as np
+import pandas as pd
+from framecheck.utilities import CheckFactory, FailingIndices, compile_match_regex
 from framecheck.column_checks import ColumnCheck
 
 
+# Shared passing result of the dummy checks; immutable so no caller can alter it
+_EMPTY_RESULT = {"messages": (), "failing_indices": frozenset()}
+
+
 # Simulated checks for testing
 class MaxCheck(ColumnCheck):
     """
@@ -41,7 +47,7 @@ class MaxCheck(ColumnCheck):
         dict
             A result dict with no messages or failures.
         """
-        return {"messages": [], "failing_indices": set()}
+        return _EMPTY_RESULT
 
 
 class RequiredCheck(ColumnCheck):
@@ -77,7 +83,7 @@ class RequiredCheck(ColumnCheck):
         dict
             A result dict with no messages or failures.
         """
-        return {"messages": [], "failing_indices": set()}
+        return _EMPTY_RESULT
 
 
 # Register the custom check types for this test
@@ -127,3 +133,89 @@ class TestCheckFactory(unittest.TestCase):
                 invalid_kwarg=True
             )
         self.assertIn("Invalid keyword arguments", str(context.exception))
+
+    def test_create_many_groups_checks_by_column(self):
+        """Test create_many builds the main and flag checks for each column in order."""
+        checks = CheckFactory.create_many(
+            'max_check', ['a', 'b'], raise_on_fail=True, max=100, required=True
+        )
+        self.assertEqual(
+            [(type(c), c.column_name) for c in checks],
+            [(MaxCheck, 'a'), (RequiredCheck, 'a'), (MaxCheck, 'b'), (RequiredCheck, 'b')]
+        )
+
+
+class TestCompileMatchRegex(unittest.TestCase):
+    """
+    Test suite for compile_match_regex, verifying compiled patterns are cached
+    and anchored at the start like re.match.
+    """
+    def test_match_is_anchored_and_cached(self):
+        """Test the pattern matches from the start and is compiled once."""
+        pattern = compile_match_regex(r'\d+')
+        self.assertIsNotNone(pattern.match('123abc'))
+        self.assertIsNone(pattern.match('abc123'))
+        self.assertIs(compile_match_regex(r'\d+'), pattern)
+
+    def test_backreference_supported(self):
+        """Test patterns outside RE2's syntax still compile."""
+        pattern = compile_match_regex(r'(a)\1')
+        self.assertIsNotNone(pattern.match('aa'))
+
+
+class TestFailingIndices(unittest.TestCase):
+    """
+    Test suite for FailingIndices, verifying it behaves like a set of index
+    labels while storing row positions as a NumPy array.
+    """
+    def test_equals_set_of_labels(self):
+        """Test positions are translated to index labels."""
+        index = pd.Index([10, 20, 30, 40])
+        failing = FailingIndices(index, np.array([1, 3]))
+        self.assertEqual(failing, {20, 40})
+        self.assertIn(20, failing)
+        self.assertNotIn(1, failing)
+        self.assertEqual(len(failing), 2)
+        self.assertEqual(list(failing), [20, 40])
+
+    def test_empty_is_falsy(self):
+        """Test an empty container is falsy and equals an empty set."""
+        failing = FailingIndices(pd.RangeIndex(3), np.array([], dtype=np.intp))
+        self.assertFalse(failing)
+        self.assertEqual(failing, set())
+
+    def test_duplicate_labels_are_deduplicated(self):
+        """Test set semantics hold for a non-unique index."""
+        index = pd.Index(['a', 'a', 'b'])
+        failing = FailingIndices(index, np.array([0, 1]))
+        self.assertEqual(len(failing), 1)
+        self.assertEqual(failing, {'a'})
+
+    def test_labels_are_python_scalars(self):
+        """Test labels keep their Python/pandas types on each index kind."""
+        ints = list(FailingIndices(pd.RangeIndex(3), np.array([2])))
+        self.assertIs(type(ints[0]), int)
+        dates = pd.date_range('2024-01-01', periods=3)
+        failing = FailingIndices(dates, np.array([0]))
+        self.assertEqual(failing, {pd.Timestamp('2024-01-01')})
+
+    def test_from_mask_is_lazy(self):
+        """Test a mask-backed container counts without building labels."""
+        mask = np.array([False, True, True, False])
+        failing = FailingIndices.from_mask(pd.Index(['a', 'b', 'c', 'd']), mask)
+        self.assertEqual(failing.count, 2)
+        self.assertIsNone(failing._label_list)
+        self.assertEqual(failing, {'b', 'c'})
+        np.testing.assert_array_equal(failing.positions, [1, 2])
+        self.assertIs(failing.mask, mask)
+
+    def test_mask_from_positions(self):
+        """Test the mask is rebuilt from positions when needed."""
+        failing = FailingIndices(pd.RangeIndex(3), np.array([2]))
+        np.testing.assert_array_equal(failing.mask, [False, False, True])
+
+    def test_set_operations(self):
+        """Test union with a regular set returns a plain set of labels."""
+        failing = FailingIndices(pd.RangeIndex(5), np.array([0, 4]))
+        self.assertEqual(failing | {2}, {0, 2, 4})
+        self.assertEqual(set().union(failing), {0, 4})
@@ -1,7 +1,9 @@
 """Unit test for frame_check.ValidationResult"""
 import unittest
+import numpy as np
 import pandas as pd
 from framecheck.frame_check import ValidationResult
+from framecheck.utilities import FailingIndices
 
 
 class TestValidationResult(unittest.TestCase):
@@ -9,9 +11,10 @@ class TestValidationResult(unittest.TestCase):
     Test suite for ValidationResult, verifying result status, summary formatting,
     row indexing, and error/warning serialization behavior.
     """
-    def setUp(self):
-        """Initialize a default DataFrame for row indexing tests."""
-        self.df = pd.DataFrame({
+    @classmethod
+    def setUpClass(cls):
+        """Build the read-only DataFrame used for row indexing tests."""
+        cls.df = pd.DataFrame({
             'a': [1, 2, 3],
             'b': ['x', 'y', 'z']
         })
@@ -56,6 +59,15 @@ class TestValidationResult(unittest.TestCase):
         with self.assertRaises(ValueError):
             result.get_invalid_rows(self.df)
 
+    def test_get_invalid_rows_reports_missing_count(self):
+        """Test the error counts missing labels, also when the index has duplicates."""
+        result = ValidationResult(errors=['err'], warnings=[], failing_row_indices={1, 98, 99})
+        with self.assertRaisesRegex(ValueError, "2 of 3 failing indices not found"):
+            result.get_invalid_rows(self.df)
+        df = pd.DataFrame({'x': [1, 2, 3]}, index=[0, 0, 1])
+        with self.assertRaisesRegex(ValueError, "2 of 3 failing indices not found"):
+            result.get_invalid_rows(df)
+
     def test_get_invalid_rows_duplicate_index(self):
         """Test raises ValueError when DataFrame has duplicate index values."""
         df = pd.DataFrame({'x': [1, 2, 3, 4]}, index=[0, 0, 1, 2])
@@ -69,6 +81,49 @@ class TestValidationResult(unittest.TestCase):
         out = result.get_invalid_rows(self.df)
         self.assertTrue(out.empty)
 
+    def test_get_invalid_rows_by_position_for_validated_frame(self):
+        """Test mask-backed results gather rows by position, in frame order."""
+        df = pd.DataFrame({'a': [1, 2, 3]}, index=['z', 'y', 'x'])
+        mask = np.array([True, False, True])
+        result = ValidationResult(
+            errors=['err'], warnings=[],
+            failing_row_indices=FailingIndices.from_mask(df.index, mask),
+            failing_mask=mask
+        )
+        out = result.get_invalid_rows(df)
+        self.assertEqual(list(out.index), ['z', 'x'])
+
+    def test_get_invalid_rows_by_label_for_other_frame(self):
+        """Test a frame other than the validated one falls back to label lookup."""
+        mask = np.array([False, True, True])
+        result = ValidationResult(
+            errors=['err'], warnings=[],
+            failing_row_indices=FailingIndices.from_mask(self.df.index, mask),
+            failing_mask=mask
+        )
+        out = result.get_invalid_rows(self.df.iloc[::-1])
+        self.assertEqual(list(out.index), [1, 2])
+        with self.assertRaises(ValueError):
+            result.get_invalid_rows(self.df.iloc[:2])
+
+    def test_iter_invalid_rows_chunked(self):
+        """Test invalid rows are yielded in chunk_size slices matching get_invalid_rows."""
+        df = pd.DataFrame({'a': range(10)})
+        mask = np.arange(10) % 2 == 1
+        result = ValidationResult(
+            errors=['err'], warnings=[],
+            failing_row_indices=FailingIndices.from_mask(df.index, mask),
+            failing_mask=mask
+        )
+        chunks = list(result.iter_invalid_rows(df, chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        pd.testing.assert_frame_equal(pd.concat(chunks), result.get_invalid_rows(df))
+        self.assertEqual(list(ValidationResult(errors=[], warnings=[]).iter_invalid_rows(self.df)), [])
+        with self.assertRaises(ValueError):
+            result.iter_invalid_rows(df, chunk_size=0)
+        with self.assertRaises(ValueError):
+            ValidationResult(errors=[], warnings=[], failing_row_indices={99}).iter_invalid_rows(df)
+
     def test_get_invalid_rows_errors_only_without_tracking(self):
         """Test raises ValueError when error-only filtering is requested but not tracked."""
         result = ValidationResult(errors=['err'], warnings=['warn'], failing_row_indices={0})
@@ -96,6 +151,15 @@ class TestValidationResult(unittest.TestCase):
         self.assertIn("Warnings:", summary)
         self.assertIn("warn 1", summary)
 
+    def test_summary_layout(self):
+        """Test the exact summary layout, with one bulleted line per message."""
+        result = ValidationResult(errors=['e1', 'e2'], warnings=['w1'])
+        self.assertEqual(
+            result.summary(),
+            "Validation FAILED\n2 error(s), 1 warning(s)\nErrors:\n  - e1\n  - e2\nWarnings:\n  - w1"
+        )
+        self.assertEqual(ValidationResult(errors=[], warnings=[]).summary(), "Validation PASSED\n0 error(s), 0 warning(s)")
+
     def test_to_dict_all_clear(self):
         """Test to_dict returns clean structure when no issues exist."""
         result = ValidationResult(errors=[], warnings=[])